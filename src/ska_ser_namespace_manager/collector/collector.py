@@ -6,8 +6,6 @@ and the bootstrapping of the kubernetes API
 import sys
 from typing import Callable, Dict, Optional, TypeVar
 
-import yaml
-
 from ska_ser_namespace_manager.collector.collector_config import (
     CollectorConfig,
 )
@@ -19,6 +17,7 @@ from ska_ser_namespace_manager.core.config import ConfigLoader
 from ska_ser_namespace_manager.core.kubernetes_api import KubernetesAPI
 from ska_ser_namespace_manager.core.logging import logging
 from ska_ser_namespace_manager.core.namespace import match_namespace
+from ska_ser_namespace_manager.core.utils import log_config
 
 T = TypeVar("T", bound=CollectorConfig)
 
@@ -68,12 +67,7 @@ class Collector(KubernetesAPI):
             )
             self.namespace_config = CollectNamespaceConfig()
 
-        logging.debug(
-            "Configuration: \n%s",
-            yaml.safe_dump(
-                yaml.safe_load(self.namespace_config.model_dump_json())
-            ),
-        )
+        log_config(self.namespace_config)
 
     @classmethod
     def get_actions(cls) -> Dict[CollectActions, Callable]:
@@ -19,6 +19,7 @@ from ska_ser_namespace_manager.controller.collect_controller_config import (
 from ska_ser_namespace_manager.core.logging import logging
 from ska_ser_namespace_manager.core.types import (
     NamespaceAnnotations,
+    NamespaceLabels,
     NamespaceStatus,
 )
 from ska_ser_namespace_manager.core.utils import format_utc, utc
@@ -47,12 +48,18 @@ class NamespaceCollector(Collector):
         status_annotations: Optional[Dict[str, str]] = None,
     ) -> None:
         """
-        Set the status and status timestamp in the annotations.
+        Set the status and status timestamp in the annotations. The status
+        and managed flag are mirrored as labels so that namespaces can be
+        selected server-side.
 
         :param status_annotations: Extra annotations to set on status change
         :param status: The status to set
         """
         annotations = status_annotations or {}
+        labels = {
+            NamespaceLabels.MANAGED.value: "true",
+            NamespaceLabels.STATUS.value: status,
+        }
         old_status = (namespace.metadata.annotations or {}).get(
             NamespaceAnnotations.STATUS.value
         )
@@ -62,6 +69,11 @@ class NamespaceCollector(Collector):
                 self.namespace,
                 status,
             )
+            old_labels = namespace.metadata.labels or {}
+            if any(
+                old_labels.get(key) != value for key, value in labels.items()
+            ):
+                self.patch_namespace(self.namespace, labels=labels)
             return
 
         annotations[NamespaceAnnotations.STATUS.value] = status
@@ -73,7 +85,9 @@ class NamespaceCollector(Collector):
             self.namespace,
             status,
         )
-        self.patch_namespace(self.namespace, annotations=annotations)
+        self.patch_namespace(
+            self.namespace, labels=labels, annotations=annotations
+        )
 
     def check_namespace(self) -> None:
         """
@@ -5,28 +5,57 @@ resources
 """
 
 import datetime
-from typing import Optional
+import functools
+from typing import Any, Optional
 
-import yaml
 from slack_bolt import App
 
 from ska_ser_namespace_manager.controller.action_controller_config import (
     ActionControllerConfig,
-    ActionNamespacePhaseConfig,
 )
 from ska_ser_namespace_manager.controller.controller import controller_task
 from ska_ser_namespace_manager.controller.leader_controller import (
     LeaderController,
 )
+from ska_ser_namespace_manager.core.informer import Informer, label_index
 from ska_ser_namespace_manager.core.logging import logging
-from ska_ser_namespace_manager.core.namespace import match_namespace
 from ska_ser_namespace_manager.core.notifier import Notifier
 from ska_ser_namespace_manager.core.types import (
     CicdAnnotations,
     NamespaceAnnotations,
+    NamespaceLabels,
     NamespaceStatus,
 )
-from ska_ser_namespace_manager.core.utils import utc
+from ska_ser_namespace_manager.core.utils import log_config, utc
+
+_TICK_1S = datetime.timedelta(seconds=1)
+_TICK_8S = datetime.timedelta(seconds=8)
+_MANAGED_LABEL = NamespaceLabels.MANAGED.value
+_STATUS_LABEL = NamespaceLabels.STATUS.value
+_STATUS = NamespaceAnnotations.STATUS.value
+_STATUS_TIMEFRAME = NamespaceAnnotations.STATUS_TIMEFRAME.value
+_STATUS_FINALIZE_AT = NamespaceAnnotations.STATUS_FINALIZE_AT.value
+_OWNER = NamespaceAnnotations.OWNER.value
+_NOTIFIED_TS = NamespaceAnnotations.NOTIFIED_TS.value
+_NOTIFIED_STATUS = NamespaceAnnotations.NOTIFIED_STATUS.value
+_JOB_URL = CicdAnnotations.JOB_URL.value
+_NOTIFY_STATUSES = (
+    NamespaceStatus.FAILING.value,
+    NamespaceStatus.UNSTABLE.value,
+)
+_NOTIFY_CONTEXTS = {
+    status: {
+        "template": f"{status}-namespace-notification.j2",
+        "status": status,
+    }
+    for status in _NOTIFY_STATUSES
+}
+_TERMINAL_STATUSES = frozenset(
+    [NamespaceStatus.STALE.value, NamespaceStatus.FAILED.value]
+)
+_NOTIFY_LABELS = {_MANAGED_LABEL: "true", _STATUS_LABEL: _NOTIFY_STATUSES}
+_NOTIFY_ANNOTATIONS = {_OWNER: ".+"}
+_NOTIFY_EXCLUDE_ANNOTATIONS = {_NOTIFIED_TS: ".+"}
 
 
 class ActionController(Notifier, LeaderController):
@@ -45,47 +74,56 @@ class ActionController(Notifier, LeaderController):
             self,
             ActionControllerConfig,
             [
-                self.delete_stale_namespaces,
-                self.delete_failed_namespaces,
+                self.delete_terminal_namespaces,
                 self.notify_failing_unstable_namespaces,
+                self.send_notifications,
             ],
             kubeconfig,
         )
         self.config: ActionControllerConfig
         Notifier.__init__(self, self.config.notifier.token)
-
-        logging.debug(
-            "Configuration: \n%s",
-            yaml.safe_dump(yaml.safe_load(self.config.model_dump_json())),
+        self.namespace_informer = Informer(
+            "namespace_informer", self.v1.list_namespace, self.shutdown_event
+        )
+        self.namespace_informer.add_index(
+            _STATUS_LABEL, label_index(_STATUS_LABEL)
         )
+        self.namespace_informer.add_handler(self.on_namespace_event)
+        self.add_tasks([self.namespace_informer])
+
+        log_config(self.config)
 
-    def delete_namespaces_with_status(self, status: str):
+    def delete_namespaces_with_statuses(self, statuses: frozenset[str]) -> int:
         """
-        Deletes namespaces with a particular status
+        Deletes namespaces with any of the given statuses using a single
+        namespace listing, filtered server-side by label
 
-        :param status: Status to search and delete
+        :param statuses: Statuses to search and delete
+        :return: Number of namespaces deleted
         """
-        namespaces = [
+        namespaces = (
             namespace
             for namespace in self.get_namespaces_by(
-                annotations={
-                    NamespaceAnnotations.MANAGED.value: "true",
-                    NamespaceAnnotations.STATUS.value: status,
+                labels={
+                    _MANAGED_LABEL: "true",
+                    _STATUS_LABEL: sorted(statuses),
                 }
             )
             if namespace.metadata.name not in self.forbidden_namespaces
-        ]
+        )
 
+        deleted = 0
         for namespace in namespaces:
-            ns_config = match_namespace(
-                self.config.namespaces, self.to_dto(namespace)
-            )
+            annotations = namespace.metadata.annotations or {}
+            status = annotations.get(_STATUS)
+            if status not in statuses:
+                continue
+
+            ns_config = self.match_namespace_config(namespace)
             if ns_config is None:
                 continue
 
-            phase_config: ActionNamespacePhaseConfig = getattr(
-                ns_config, status
-            )
+            phase_config = ns_config.get_phase_config(status)
             if not phase_config.delete:
                 logging.debug(
                     "Namespace '%s' is %s but won't be deleted",
@@ -109,96 +147,118 @@ class ActionController(Notifier, LeaderController):
             self.delete_namespace(
                 namespace.metadata.name,
             )
+            deleted += 1
 
-            annotations = namespace.metadata.annotations or {}
-            if phase_config.notify_on_delete:
-                self.notify_user(
-                    address=annotations.get(
-                        NamespaceAnnotations.OWNER.value, ""
-                    ),
+            if phase_config.notify_on_delete and self.slack_client:
+                self.queue_notification(
+                    address=annotations.get(_OWNER, ""),
                     template="namespace-deleted-notification.j2",
                     status=status,
                     target_namespace=namespace.metadata.name,
-                    status_timeframe=annotations.get(
-                        NamespaceAnnotations.STATUS_TIMEFRAME.value,
-                    ),
-                    job_url=namespace.metadata.annotations.get(
-                        CicdAnnotations.JOB_URL.value
-                    ),
+                    status_timeframe=annotations.get(_STATUS_TIMEFRAME),
+                    job_url=annotations.get(_JOB_URL),
                 )
 
-    @controller_task(period=datetime.timedelta(seconds=1))
-    def delete_stale_namespaces(self) -> None:
-        """
-        Looks for namespaces with stale status and deletes them
-        :return:
-        """
-        self.delete_namespaces_with_status(NamespaceStatus.STALE.value)
+        return deleted
 
-    @controller_task(period=datetime.timedelta(seconds=1))
-    def delete_failed_namespaces(self) -> None:
+    @controller_task(period=_TICK_1S, max_period=_TICK_8S)
+    def delete_terminal_namespaces(self) -> int:
         """
-        Looks for namespaces with failed status and deletes them
-        :return:
+        Looks for namespaces with stale or failed status and deletes them
+        :return: Number of namespaces deleted
         """
-        self.delete_namespaces_with_status(NamespaceStatus.FAILED.value)
+        return self.delete_namespaces_with_statuses(_TERMINAL_STATUSES)
 
-    @controller_task(period=datetime.timedelta(seconds=1))
-    def notify_failing_unstable_namespaces(self) -> None:
+    @controller_task(period=_TICK_1S, max_period=_TICK_8S)
+    def notify_failing_unstable_namespaces(self) -> int:
         """
-        Looks for namespaces with failing or unstable status and notifies their
-        owners
-        :return:
+        Looks for namespaces with failing or unstable status and queues
+        notifications to their owners
+        :return: Number of notifications queued
         """
-        namespaces = [
+        if self.slack_client is None:
+            return 0
+
+        namespaces = (
             namespace
             for namespace in self.get_namespaces_by(
-                annotations={
-                    NamespaceAnnotations.MANAGED.value: "true",
-                    NamespaceAnnotations.STATUS.value: "(failing|unstable)",
-                    NamespaceAnnotations.OWNER.value: ".+",
-                },
-                exclude_annotations={
-                    NamespaceAnnotations.NOTIFIED_TS.value: ".+"
-                },
+                labels=_NOTIFY_LABELS,
+                annotations=_NOTIFY_ANNOTATIONS,
+                exclude_annotations=_NOTIFY_EXCLUDE_ANNOTATIONS,
             )
             if namespace.metadata.name not in self.forbidden_namespaces
-        ]
+        )
 
+        notified = 0
         for namespace in namespaces:
             annotations = namespace.metadata.annotations or {}
-            ns_config = match_namespace(
-                self.config.namespaces, self.to_dto(namespace)
-            )
+            status = annotations.get(_STATUS)
+            notify_context = _NOTIFY_CONTEXTS.get(status)
+            if notify_context is None:
+                continue
+
+            ns_config = self.match_namespace_config(namespace)
             if ns_config is None:
                 continue
 
-            status = annotations.get(NamespaceAnnotations.STATUS.value)
-            phase_config: ActionNamespacePhaseConfig = getattr(
-                ns_config, status
-            )
+            phase_config = ns_config.get_phase_config(status)
             if not phase_config.notify_on_status:
                 continue
 
-            if self.notify_user(
-                address=annotations.get(NamespaceAnnotations.OWNER.value, ""),
-                template=f"{status}-namespace-notification.j2",
-                status=status,
-                target_namespace=namespace.metadata.name,
-                status_timeframe=annotations.get(
-                    NamespaceAnnotations.STATUS_TIMEFRAME.value
-                ),
-                finalize_at=namespace.metadata.annotations.get(
-                    NamespaceAnnotations.STATUS_FINALIZE_AT.value
-                ),
-                job_url=namespace.metadata.annotations.get(
-                    CicdAnnotations.JOB_URL.value
+            if self.queue_notification(
+                address=annotations.get(_OWNER, ""),
+                key=(namespace.metadata.name, status),
+                callback=functools.partial(
+                    self.set_notified, namespace.metadata.name, status
                 ),
+                target_namespace=namespace.metadata.name,
+                status_timeframe=annotations.get(_STATUS_TIMEFRAME),
+                finalize_at=annotations.get(_STATUS_FINALIZE_AT),
+                job_url=annotations.get(_JOB_URL),
+                **notify_context,
             ):
-                annotations[NamespaceAnnotations.NOTIFIED_TS.value] = utc()
-                annotations[NamespaceAnnotations.NOTIFIED_STATUS.value] = (
-                    status
-                )
-                self.patch_namespace(
-                    namespace.metadata.name, annotations=annotations
-                )
+                notified += 1
+
+        return notified
+
+    def set_notified(self, namespace: str, status: str) -> bool:
+        """
+        Marks the namespace owner as notified of a status. Only the
+        notification annotations are sent in the patch
+
+        :param namespace: Name of the namespace
+        :param status: Status the owner was notified of
+        :return: True if the namespace was patched, in which case the
+        notification stays pending until the informer sees the patch
+        """
+        return self.patch_namespace(
+            namespace,
+            annotations={_NOTIFIED_TS: utc(), _NOTIFIED_STATUS: status},
+        )
+
+    def on_namespace_event(self, event_type: str, namespace: Any) -> None:
+        """
+        Release the pending notifications of namespaces seen by the
+        namespace informer as notified or deleted, so that they are only
+        notified again once the informer cache reflects the notification.
+        Added or modified namespaces can carry a new status, so idle tasks
+        are woken up to act on it
+
+        :param event_type: Type of the watch event
+        :param namespace: Namespace in the event
+        """
+        if event_type != "DELETED":
+            self.wake_tasks()
+
+        annotations = namespace.metadata.annotations or {}
+        if event_type == "DELETED" or annotations.get(_NOTIFIED_TS):
+            for status in _NOTIFY_STATUSES:
+                self.release_notification((namespace.metadata.name, status))
+
+    @controller_task(period=_TICK_1S)
+    def send_notifications(self) -> int:
+        """
+        Sends the queued notifications
+        :return: Number of notifications sent
+        """
+        return self.process_notifications()
@@ -3,9 +3,9 @@ action_controller_config centralizes all the configuration loading
 for the action controller component
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from ska_ser_namespace_manager.controller.leader_controller_config import (
     LeaderControllerConfig,
@@ -47,6 +47,28 @@ class ActionNamespaceConfig(NamespaceMatcher):
     unstable: ActionNamespacePhaseConfig = ActionNamespacePhaseConfig(
         delete=False, notify_on_delete=False, notify_on_status=True
     )
+    _phase_by_status: Dict[str, ActionNamespacePhaseConfig] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def model_post_init(self, _):
+        self._phase_by_status = {
+            "stale": self.stale,
+            "failed": self.failed,
+            "failing": self.failing,
+            "unstable": self.unstable,
+        }
+
+    def get_phase_config(
+        self, status: str
+    ) -> Optional[ActionNamespacePhaseConfig]:
+        """
+        Get the configuration on how to act on a namespace status
+
+        :param status: Status of the namespace
+        :return: The configuration for the status, if any
+        """
+        return self._phase_by_status.get(status)
 
 
 class NotifierConfig(BaseModel):
@@ -4,8 +4,14 @@ is responsible for creating tasks to collect information on managed
 resources
 """
 
+import copy
 import datetime
-from typing import Optional
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 import yaml
 
@@ -21,16 +27,38 @@ from ska_ser_namespace_manager.controller.controller import (
 from ska_ser_namespace_manager.controller.leader_controller import (
     LeaderController,
 )
+from ska_ser_namespace_manager.core.informer import Informer, label_index
+from ska_ser_namespace_manager.core.kubernetes_api import (
+    APPLY_PATCH_CONTENT_TYPE,
+    FIELD_MANAGER,
+)
 from ska_ser_namespace_manager.core.logging import logging
-from ska_ser_namespace_manager.core.namespace import match_namespace
 from ska_ser_namespace_manager.core.types import (
     NamespaceAnnotations,
+    NamespaceLabels,
     NamespaceStatus,
 )
+from ska_ser_namespace_manager.core.utils import (
+    YamlLoader,
+    log_config,
+    spec_hash,
+)
 from ska_ser_namespace_manager.metrics.metrics import MetricsManager
 
+EXECUTOR_MAX_WORKERS = 16
+FULL_SYNC_INTERVAL = 60.0
+_MANAGED_ANNOTATION = NamespaceAnnotations.MANAGED.value
+_MANAGED_VALUE = "true"
+_TICK_1S = datetime.timedelta(seconds=1)
+_TICK_5S = datetime.timedelta(seconds=5)
+_TICK_10S = datetime.timedelta(seconds=10)
+
 
-class CollectController(LeaderController):
+# The informers, executor and caches are shared by the controller tasks,
+# so they are kept as attributes of the controller
+class CollectController(  # pylint: disable=too-many-instance-attributes
+    LeaderController
+):
     """
     CollectController is responsible for creating tasks to collect
     information on managed resources and manage those tasks
@@ -39,6 +67,13 @@ class CollectController(LeaderController):
     namespace_cronjobs: list[CollectActions]
     namespace_jobs: list[CollectActions]
     metrics_manager: MetricsManager
+    manifests: dict[tuple, Any]
+    labeled_actions: set[tuple[str, CollectActions]]
+    last_synchronized: dict[str, tuple[int, float]]
+    new_namespaces: queue.Queue
+    dirty_namespaces: set[str]
+    dirty_namespaces_lock: threading.Lock
+    executor: ThreadPoolExecutor
 
     def __init__(self, kubeconfig: Optional[str] = None) -> None:
         """
@@ -53,20 +88,53 @@ class CollectController(LeaderController):
 
         self.config: CollectControllerConfig
         self.metrics_manager = MetricsManager(self.config.metrics)
-        logging.debug(
-            "Configuration: \n%s",
-            yaml.safe_dump(yaml.safe_load(self.config.model_dump_json())),
-        )
+        log_config(self.config)
         self.add_tasks(
             [
                 self.synchronize_cronjobs,
                 self.synchronize_jobs,
                 self.generate_metrics,
+                self.save_metrics,
             ]
         )
 
         self.namespace_cronjobs = [CollectActions.CHECK_NAMESPACE]
         self.namespace_jobs = [CollectActions.GET_OWNER_INFO]
+        self.manifests = {}
+        self.labeled_actions = set()
+        self.last_synchronized = {}
+        self.new_namespaces = queue.Queue()
+        self.dirty_namespaces = set()
+        self.dirty_namespaces_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="collect",
+        )
+        self.namespace_informer = Informer(
+            "namespace_informer", self.v1.list_namespace, self.shutdown_event
+        )
+        self.namespace_informer.add_handler(self.on_namespace_event)
+        self.cronjob_informer = Informer(
+            "cronjob_informer",
+            self.batch_v1.list_namespaced_cron_job,
+            self.shutdown_event,
+            namespace=self.config.context.namespace,
+        )
+        self.job_informer = Informer(
+            "job_informer",
+            self.batch_v1.list_namespaced_job,
+            self.shutdown_event,
+            namespace=self.config.context.namespace,
+        )
+        for informer in (self.cronjob_informer, self.job_informer):
+            informer.add_index(
+                NamespaceLabels.ACTION.value,
+                label_index(NamespaceLabels.ACTION.value),
+            )
+
+        self.add_tasks(
+            [self.namespace_informer, self.cronjob_informer, self.job_informer]
+        )
 
     def is_metrics_enabled(self) -> bool:
         """
@@ -74,45 +142,179 @@ class CollectController(LeaderController):
         """
         return self.config.metrics.enabled
 
-    @controller_task(period=datetime.timedelta(seconds=1))
-    def check_new_namespaces(self) -> None:
+    def is_unmanaged(self, namespace: Any) -> bool:
+        """
+        Check if a namespace is neither managed nor forbidden
+
+        :param namespace: Namespace to check
+        :return: True if the namespace can be onboarded, False otherwise
         """
-        Check for new namespaces and create collection jobs
+        annotations = namespace.metadata.annotations or {}
+        return (
+            annotations.get(_MANAGED_ANNOTATION) != _MANAGED_VALUE
+            and namespace.metadata.name not in self.forbidden_namespaces
+        )
+
+    def on_namespace_event(self, event_type: str, namespace: Any) -> None:
         """
-        unmanaged_namespaces = [
+        Queue unmanaged namespaces seen by the namespace informer to be
+        checked by check_new_namespaces, mark changed namespaces for
+        generate_metrics and evict the matches of deleted namespaces
+
+        :param event_type: Type of the watch event
+        :param namespace: Namespace in the event
+        """
+        with self.dirty_namespaces_lock:
+            self.dirty_namespaces.add(namespace.metadata.name)
+
+        if event_type == "DELETED":
+            self.evict_namespace_match(namespace)
+
+        if event_type in ("ADDED", "MODIFIED") and self.is_unmanaged(
             namespace
-            for namespace in self.get_namespaces_by(
-                exclude_annotations={
-                    NamespaceAnnotations.MANAGED.value: "true"
-                }
-            )
-            if namespace.metadata.name not in self.forbidden_namespaces
-        ]
+        ):
+            self.new_namespaces.put(namespace.metadata.name)
 
-        for namespace in unmanaged_namespaces:
-            ns_config = match_namespace(
-                self.config.namespaces, self.to_dto(namespace)
+    @controller_task(period=_TICK_1S)
+    def check_new_namespaces(self) -> None:
+        """
+        Check the namespaces queued by the namespace informer and create
+        collection jobs. Namespaces are onboarded concurrently and queued
+        again if onboarding fails
+        """
+        names = []
+        while True:
+            try:
+                names.append(self.new_namespaces.get_nowait())
+            except queue.Empty:
+                break
+
+        futures = {}
+        for name in dict.fromkeys(names):
+            namespace = self.namespace_informer.get(name)
+            if namespace is None or not self.is_unmanaged(namespace):
+                continue
+
+            futures[name] = self.executor.submit(
+                self.onboard_namespace, namespace
             )
-            if ns_config:
-                namespace = namespace.metadata.name
-                logging.info(
-                    "Managing new namespace '%s'",
-                    namespace,
-                )
-                for action in self.namespace_cronjobs:
-                    self.create_collect_cronjob(action, namespace, ns_config)
-
-                for action in self.namespace_jobs:
-                    self.create_collect_job(action, namespace, ns_config)
-
-                self.patch_namespace(
-                    namespace,
-                    annotations={
-                        NamespaceAnnotations.STATUS: NamespaceStatus.UNKNOWN.value,  # pylint: disable=line-too-long  # noqa: E501
-                        NamespaceAnnotations.MANAGED: "true",
-                        NamespaceAnnotations.NAMESPACE: namespace,
-                    },
+
+        for name, future in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                logging.error(
+                    "Failed to onboard namespace '%s': %s", name, exc
                 )
+                traceback.print_exception(exc)
+                self.new_namespaces.put(name)
+
+    def onboard_namespace(self, namespace: Any) -> None:
+        """
+        Create the collection jobs of a namespace matching a collect
+        configuration and mark it as managed
+
+        :param namespace: Namespace to onboard
+        """
+        ns_config = self.match_namespace_config(namespace)
+        if not ns_config:
+            return
+
+        namespace = namespace.metadata.name
+        logging.info(
+            "Managing new namespace '%s'",
+            namespace,
+        )
+        for action in self.namespace_cronjobs:
+            self.create_collect_cronjob(action, namespace, ns_config)
+
+        for action in self.namespace_jobs:
+            self.create_collect_job(action, namespace, ns_config)
+
+        self.apply_namespace(
+            namespace,
+            labels={
+                NamespaceLabels.STATUS: NamespaceStatus.UNKNOWN.value,
+                NamespaceLabels.MANAGED: "true",
+            },
+            annotations={
+                NamespaceAnnotations.STATUS: NamespaceStatus.UNKNOWN.value,
+                NamespaceAnnotations.MANAGED: "true",
+                NamespaceAnnotations.NAMESPACE: namespace,
+            },
+        )
+
+    def render_manifest(
+        self,
+        kind: str,
+        action: CollectActions,
+        namespace: str,
+        config: CollectNamespaceConfig,
+    ) -> Any:
+        """
+        Get the manifest of a collection resource for the given namespace.
+        The template is rendered and parsed once per kind, action, namespace
+        and configuration, and a copy of the parsed manifest is returned on
+        every call. The manifest is annotated with a hash of the rendered
+        template
+
+        :param kind: Kind of the resource template, either cronjob or job
+        :param action: Action to run in the resource
+        :param namespace: The namespace to get the manifest for
+        :param config: Config governing this namespace collection configuration
+        :return: Parsed manifest
+        """
+        key = (kind, action, namespace, id(config))
+        manifest = self.manifests.get(key)
+        if manifest is None:
+            rendered = self.template_factory.render(
+                f"{action}-{kind}.j2",
+                target_namespace=namespace,
+                action=str(action),
+                actions=config.actions,
+                context=self.config.context,
+            )
+            manifest = yaml.load(rendered, Loader=YamlLoader)
+            digest = spec_hash(rendered)
+            metadata = manifest.setdefault("metadata", {})
+            if metadata.get("annotations") is None:
+                metadata["annotations"] = {}
+
+            metadata["annotations"][NamespaceAnnotations.SPEC_HASH] = digest
+            self.manifests[key] = manifest
+
+        return copy.deepcopy(manifest)
+
+    @staticmethod
+    def is_up_to_date(resource: Any, manifest: Any) -> bool:
+        """
+        Check if a resource was last applied from a manifest, by comparing
+        their spec hash annotations
+
+        :param resource: Existing resource
+        :param manifest: Manifest rendered by render_manifest
+        :return: True if the resource does not need to be patched
+        """
+        annotations = resource.metadata.annotations or {}
+        digest = annotations.get(NamespaceAnnotations.SPEC_HASH.value)
+        return (
+            digest is not None
+            and digest
+            == manifest["metadata"]["annotations"][
+                NamespaceAnnotations.SPEC_HASH
+            ]
+        )
+
+    def evict_manifests(self, namespace: str) -> None:
+        """
+        Evict the cached manifests of a namespace. Executor workers can
+        render manifests and evict them concurrently, so the keys are
+        snapshotted and missing keys are ignored
+
+        :param namespace: The namespace to evict the manifests of
+        """
+        for key in list(self.manifests):
+            if key[2] == namespace:
+                self.manifests.pop(key, None)
 
     def create_collect_cronjob(
         self,
@@ -121,104 +323,227 @@ class CollectController(LeaderController):
         config: CollectNamespaceConfig,
     ) -> None:
         """
-        Create a new CronJob for the given namespace to actively collect
-        namespace information
+        Create or update the CronJob for the given namespace to actively
+        collect namespace information, using a server-side apply
 
         :param action: Action to run in the cronjob
         :param namespace: The namespace to create the CronJob for
         :param config: Config governing this namespace collection configuration
         """
-        manifest = self.template_factory.render(
-            f"{action}-cronjob.j2",
-            target_namespace=namespace,
-            action=str(action),
-            actions=config.actions,
-            context=self.config.context,
+        manifest = self.render_manifest("cronjob", action, namespace, config)
+        self.batch_v1.patch_namespaced_cron_job(
+            manifest["metadata"]["name"],
+            self.config.context.namespace,
+            manifest,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+            _request_timeout=10,
         )
-        existing_cronjobs = self.get_cronjobs_by(
-            namespace=self.config.context.namespace,
-            annotations={
-                NamespaceAnnotations.NAMESPACE: namespace,
-                NamespaceAnnotations.ACTION: action,
-            },
+        logging.info(
+            "Applied '%s' CronJob for namespace '%s'", action, namespace
         )
 
-        if len(existing_cronjobs) > 0:
-            self.batch_v1.patch_namespaced_cron_job(
-                existing_cronjobs[0].metadata.name,
-                self.config.context.namespace,
-                yaml.safe_load(manifest),
-                _request_timeout=10,
-            )
-            logging.info(
-                "Patched '%s' CronJob for namespace '%s'", action, namespace
+    def needs_synchronization(
+        self, task: str, informer: Informer
+    ) -> Optional[int]:
+        """
+        Check if a synchronization task has to run. Tasks are skipped while
+        neither the namespace informer nor the informer of the synchronized
+        resources have seen changes since their last run, for up to
+        FULL_SYNC_INTERVAL
+
+        :param task: Name of the synchronization task
+        :param informer: Informer of the synchronized resources
+        :return: Combined informer generation to record once the task
+        completes, or None if the task can be skipped
+        """
+        generation = -1
+        if (
+            self.namespace_informer.synced.is_set()
+            and informer.synced.is_set()
+        ):
+            generation = (
+                self.namespace_informer.generation + informer.generation
             )
-        else:
-            self.batch_v1.create_namespaced_cron_job(
-                self.config.context.namespace,
-                yaml.safe_load(manifest),
+
+        last = self.last_synchronized.get(task)
+        if (
+            generation >= 0
+            and last is not None
+            and last[0] == generation
+            and time.monotonic() - last[1] < FULL_SYNC_INTERVAL
+        ):
+            logging.debug("Skipping %s, resources are unchanged", task)
+            return None
+
+        return generation
+
+    def get_resources_by_action(
+        self,
+        kind: str,
+        actions: list[CollectActions],
+        list_func: Callable[..., list],
+        namespace: str,
+    ) -> dict[CollectActions, list]:
+        """
+        List the collection resources of a set of actions, grouped by action.
+        Labelled actions are listed at once with a single label selector.
+        Resources created before they were labelled are only found by
+        annotation, so an action is listed by annotation until a first
+        synchronization pass has patched its resources with the action label
+
+        :param kind: Kind of the resources, either cronjob or job
+        :param actions: Actions of the resources
+        :param list_func: Either get_cronjobs_by or get_jobs_by
+        :param namespace: Namespace of the collection resources
+        :return: Resources of each action
+        """
+        resources: dict[CollectActions, list] = {
+            action: [] for action in actions
+        }
+        labeled = [
+            str(action)
+            for action in actions
+            if (kind, action) in self.labeled_actions
+        ]
+        if labeled:
+            for resource in list_func(
+                namespace=namespace,
+                labels={NamespaceLabels.ACTION.value: labeled},
+            ):
+                action = (resource.metadata.labels or {}).get(
+                    NamespaceLabels.ACTION.value
+                )
+                if action in resources:
+                    resources[action].append(resource)
+
+        for action in actions:
+            if (kind, action) not in self.labeled_actions:
+                resources[action] = list_func(
+                    namespace=namespace,
+                    annotations={NamespaceAnnotations.ACTION: action},
+                )
+
+        return resources
+
+    def wait_synchronized(
+        self, kind: str, futures: list[tuple[str, Future]]
+    ) -> bool:
+        """
+        Wait for the synchronization of a set of resources, logging failures
+
+        :param kind: Kind of the resources, for logging
+        :param futures: Names of the resources and their synchronization
+        futures
+        :return: True if all resources were synchronized, False otherwise
+        """
+        synchronized = True
+        for name, future in futures:
+            exc = future.exception()
+            if exc is not None:
+                logging.error(
+                    "Failed to synchronize %s '%s': %s", kind, name, exc
+                )
+                traceback.print_exception(exc)
+                synchronized = False
+
+        return synchronized
+
+    def synchronize_cronjob(
+        self, action: CollectActions, cronjob: Any, controller_namespace: str
+    ) -> None:
+        """
+        Synchronize a created cronjob by applying or deleting it
+
+        :param action: Action run by the cronjob
+        :param cronjob: CronJob to synchronize
+        :param controller_namespace: Namespace of the collection resources
+        """
+        namespace = cronjob.metadata.annotations.get(
+            NamespaceAnnotations.NAMESPACE
+        )
+        ns = self.get_namespace(namespace)
+        if ns is None:
+            self.batch_v1.delete_namespaced_cron_job(
+                cronjob.metadata.name,
+                controller_namespace,
                 _request_timeout=10,
             )
+            self.evict_manifests(namespace)
             logging.info(
-                "Created '%s' CronJob for namespace '%s'", action, namespace
+                "Deleted '%s' CronJob for namespace '%s'", action, namespace
             )
+            return
+
+        ns_config = self.match_namespace_config(ns)
+        manifest = self.render_manifest(
+            "cronjob", action, namespace, ns_config
+        )
+        if self.is_up_to_date(cronjob, manifest):
+            return
+
+        self.batch_v1.patch_namespaced_cron_job(
+            cronjob.metadata.name,
+            controller_namespace,
+            manifest,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+            _request_timeout=10,
+        )
+        logging.debug(
+            "Applied '%s' CronJob for namespace '%s'", action, namespace
+        )
 
     @conditional_controller_task(
-        period=datetime.timedelta(milliseconds=10000),
+        period=_TICK_10S,
         run_if=LeaderController.is_leader,
     )
     def synchronize_cronjobs(self) -> None:
         """
         Synchronize created cronjobs by patching or deleting them
         """
-        for action in self.namespace_cronjobs:
-            cronjobs = self.get_cronjobs_by(
-                namespace=self.config.context.namespace,
-                annotations={
-                    NamespaceAnnotations.ACTION: action,
-                },
-            )
-
-            for cronjob in cronjobs:
-                namespace = cronjob.metadata.annotations.get(
-                    NamespaceAnnotations.NAMESPACE
-                )
-                ns = self.get_namespace(namespace)
-                if ns is None:
-                    self.batch_v1.delete_namespaced_cron_job(
-                        cronjob.metadata.name,
-                        self.config.context.namespace,
-                        _request_timeout=10,
-                    )
-                    logging.info(
-                        "Deleted '%s' CronJob for namespace '%s'",
-                        action,
-                        namespace,
-                    )
-                    continue
-
-                ns_config = match_namespace(
-                    self.config.namespaces, self.to_dto(ns)
-                )
-                self.batch_v1.patch_namespaced_cron_job(
+        generation = self.needs_synchronization(
+            "synchronize_cronjobs", self.cronjob_informer
+        )
+        if generation is None:
+            return
+
+        controller_namespace = self.config.context.namespace
+        futures = []
+        actions = []
+        for action, cronjobs in self.get_resources_by_action(
+            "cronjob",
+            self.namespace_cronjobs,
+            self.get_cronjobs_by,
+            controller_namespace,
+        ).items():
+            futures.extend(
+                (
                     cronjob.metadata.name,
-                    self.config.context.namespace,
-                    yaml.safe_load(
-                        self.template_factory.render(
-                            f"{action}-cronjob.j2",
-                            target_namespace=namespace,
-                            action=str(action),
-                            actions=ns_config.actions,
-                            context=self.config.context,
-                        )
+                    self.executor.submit(
+                        self.synchronize_cronjob,
+                        action,
+                        cronjob,
+                        controller_namespace,
                     ),
-                    _request_timeout=10,
-                )
-                logging.debug(
-                    "Patched '%s' CronJob for namespace '%s'",
-                    action,
-                    namespace,
                 )
+                for cronjob in cronjobs
+            )
+            if cronjobs:
+                actions.append(action)
+
+        # Actions are only listed by label once all their resources were
+        # applied with it, otherwise failed resources would be orphaned
+        if self.wait_synchronized("CronJob", futures):
+            self.labeled_actions.update(
+                ("cronjob", action) for action in actions
+            )
+            self.last_synchronized["synchronize_cronjobs"] = (
+                generation,
+                time.monotonic(),
+            )
 
     def create_collect_job(
         self,
@@ -227,146 +552,192 @@ class CollectController(LeaderController):
         config: CollectNamespaceConfig,
     ) -> None:
         """
-        Create a new Job for the given namespace to collect
-        namespace information
+        Create or update the Job for the given namespace to collect
+        namespace information, using a server-side apply
 
         :param namespace: The namespace to create the CronJob for
         :param config: Config governing this namespace collection configuration
         """
-        manifest = self.template_factory.render(
-            f"{action}-job.j2",
-            target_namespace=namespace,
-            action=str(action),
-            actions=config.actions,
-            context=self.config.context,
+        manifest = self.render_manifest("job", action, namespace, config)
+        self.batch_v1.patch_namespaced_job(
+            manifest["metadata"]["name"],
+            self.config.context.namespace,
+            manifest,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+            _request_timeout=10,
         )
+        logging.info("Applied '%s' Job for namespace '%s'", action, namespace)
 
-        existing_jobs = self.get_jobs_by(
-            namespace=self.config.context.namespace,
-            annotations={
-                NamespaceAnnotations.NAMESPACE: namespace,
-                NamespaceAnnotations.ACTION: action,
-            },
-        )
+    def synchronize_job(
+        self, action: CollectActions, job: Any, controller_namespace: str
+    ) -> None:
+        """
+        Synchronize a created job by applying it, or deleting it along with
+        its pods
 
-        if len(existing_jobs) > 0:
-            self.batch_v1.patch_namespaced_job(
-                existing_jobs[0].metadata.name,
-                self.config.context.namespace,
-                yaml.safe_load(manifest),
-                _request_timeout=10,
-            )
-            logging.info(
-                "Patched '%s' Job for namespace '%s'", action, namespace
-            )
-        else:
-            self.batch_v1.create_namespaced_job(
-                self.config.context.namespace,
-                yaml.safe_load(manifest),
+        :param action: Action run by the job
+        :param job: Job to synchronize
+        :param controller_namespace: Namespace of the collection resources
+        """
+        namespace = job.metadata.annotations.get(
+            NamespaceAnnotations.NAMESPACE
+        )
+        ns = self.get_namespace(namespace)
+        if ns is None:
+            # Deleting jobs orphans their pods by default, have the garbage
+            # collector delete them instead
+            self.batch_v1.delete_namespaced_job(
+                job.metadata.name,
+                controller_namespace,
+                propagation_policy="Background",
                 _request_timeout=10,
             )
+            self.evict_manifests(namespace)
             logging.info(
-                "Created '%s' Job for namespace '%s'", action, namespace
+                "Deleted '%s' Job for namespace '%s'", action, namespace
             )
+            return
+
+        ns_config = self.match_namespace_config(ns)
+        manifest = self.render_manifest("job", action, namespace, ns_config)
+        if self.is_up_to_date(job, manifest):
+            return
+
+        self.batch_v1.patch_namespaced_job(
+            job.metadata.name,
+            controller_namespace,
+            manifest,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+            _request_timeout=10,
+        )
+        logging.debug("Applied '%s' Job for namespace '%s'", action, namespace)
 
     @conditional_controller_task(
-        period=datetime.timedelta(milliseconds=10000),
+        period=_TICK_10S,
         run_if=LeaderController.is_leader,
     )
     def synchronize_jobs(self) -> None:
         """
         Synchronize created jobs by patching or deleting them
         """
-        for action in self.namespace_jobs:
-            jobs = self.get_jobs_by(
-                namespace=self.config.context.namespace,
-                annotations={
-                    NamespaceAnnotations.ACTION: action,
-                },
-            )
-
-            for job in jobs:
-                namespace = job.metadata.annotations.get(
-                    NamespaceAnnotations.NAMESPACE
-                )
-                ns = self.get_namespace(namespace)
-                if ns is None:
-                    self.batch_v1.delete_namespaced_job(
-                        job.metadata.name,
-                        self.config.context.namespace,
-                        _request_timeout=10,
-                    )
-                    logging.info(
-                        "Deleted '%s' Job for namespace '%s'",
-                        action,
-                        namespace,
-                    )
-
-                    job_pods = self.get_namespace_pods_by(
-                        namespace=self.config.context.namespace,
-                        labels={
-                            "job-name": job.metadata.name,
-                        },
-                    )
-
-                    for pod in job_pods:
-                        self.v1.delete_namespaced_pod(
-                            pod.metadata.name,
-                            self.config.context.namespace,
-                            _request_timeout=10,
-                        )
-                        logging.info(
-                            "Deleted '%s' Pod from Job '%s'"
-                            " for namespace '%s'",
-                            action,
-                            job.metadata.name,
-                            namespace,
-                        )
-
-                    continue
-
-                ns_config = match_namespace(
-                    self.config.namespaces, self.to_dto(ns)
-                )
-                self.batch_v1.patch_namespaced_job(
+        generation = self.needs_synchronization(
+            "synchronize_jobs", self.job_informer
+        )
+        if generation is None:
+            return
+
+        controller_namespace = self.config.context.namespace
+        futures = []
+        actions = []
+        for action, jobs in self.get_resources_by_action(
+            "job", self.namespace_jobs, self.get_jobs_by, controller_namespace
+        ).items():
+            futures.extend(
+                (
                     job.metadata.name,
-                    self.config.context.namespace,
-                    yaml.safe_load(
-                        self.template_factory.render(
-                            f"{action}-job.j2",
-                            target_namespace=namespace,
-                            action=action,
-                            actions=ns_config.actions,
-                            context=self.config.context,
-                        )
+                    self.executor.submit(
+                        self.synchronize_job,
+                        action,
+                        job,
+                        controller_namespace,
                     ),
-                    _request_timeout=10,
-                )
-                logging.debug(
-                    "Patched '%s' Job for namespace '%s'", action, namespace
                 )
+                for job in jobs
+            )
+            if jobs:
+                actions.append(action)
+
+        # Actions are only listed by label once all their resources were
+        # applied with it, otherwise failed resources would be orphaned
+        if self.wait_synchronized("Job", futures):
+            self.labeled_actions.update(("job", action) for action in actions)
+            self.last_synchronized["synchronize_jobs"] = (
+                generation,
+                time.monotonic(),
+            )
 
     @conditional_controller_task(
-        period=datetime.timedelta(seconds=5),
+        period=_TICK_5S,
         run_if=lambda instance: LeaderController.is_leader(instance)
         and instance.is_metrics_enabled(),
     )
     def generate_metrics(self) -> None:
         """
-        Generates metrics on the managed namespaces
+        Generates metrics on the managed namespaces. Once the namespace
+        informer is synced, only the namespaces it saw change since the
+        last run are updated, with a full pass every FULL_SYNC_INTERVAL
         """
-        managed_namespaces = [
-            namespace
-            for namespace in self.get_namespaces_by(
-                annotations={NamespaceAnnotations.MANAGED.value: "true"}
-            )
-            if namespace.metadata.name not in self.forbidden_namespaces
-        ]
-        self.metrics_manager.delete_stale_metrics(
-            [ns.metadata.name for ns in managed_namespaces]
-        )
+        with self.dirty_namespaces_lock:
+            dirty_namespaces = self.dirty_namespaces
+            self.dirty_namespaces = set()
+
+        last = self.last_synchronized.get("generate_metrics")
+        if (
+            not self.namespace_informer.synced.is_set()
+            or last is None
+            or time.monotonic() - last[1] >= FULL_SYNC_INTERVAL
+        ):
+            self.generate_all_metrics()
+            return
+
+        managed_namespaces = []
+        unmanaged_names = []
+        for name in dirty_namespaces:
+            namespace = self.namespace_informer.get(name)
+            if (
+                namespace is None
+                or name in self.forbidden_namespaces
+                or (namespace.metadata.annotations or {}).get(
+                    _MANAGED_ANNOTATION
+                )
+                != _MANAGED_VALUE
+            ):
+                unmanaged_names.append(name)
+            else:
+                managed_namespaces.append(namespace)
 
-        for ns in managed_namespaces:
-            self.metrics_manager.update_namespace_metrics(ns)
+        self.metrics_manager.delete_namespaces_metrics(unmanaged_names)
+        self.metrics_manager.update_namespaces_metrics(managed_namespaces)
 
-        self.metrics_manager.save_metrics()
+    def generate_all_metrics(self) -> None:
+        """
+        Generates metrics on all managed namespaces, deleting the metrics
+        of namespaces no longer managed
+        """
+        synced = self.namespace_informer.synced.is_set()
+        managed_namespaces = []
+        managed_names = []
+        for namespace in self.get_namespaces_by(
+            annotations={_MANAGED_ANNOTATION: _MANAGED_VALUE}
+        ):
+            name = namespace.metadata.name
+            if name in self.forbidden_namespaces:
+                continue
+
+            managed_namespaces.append(namespace)
+            managed_names.append(name)
+
+        self.metrics_manager.delete_stale_metrics(managed_names)
+        self.metrics_manager.update_namespaces_metrics(managed_namespaces)
+        if synced:
+            self.last_synchronized["generate_metrics"] = (
+                self.namespace_informer.generation,
+                time.monotonic(),
+            )
+
+    @conditional_controller_task(
+        period=_TICK_5S,
+        run_if=lambda instance: LeaderController.is_leader(instance)
+        and instance.is_metrics_enabled(),
+    )
+    def save_metrics(self) -> None:
+        """
+        Saves the metrics generated since the last save, so that writing
+        the metrics file does not delay metrics generation
+        """
+        if self.metrics_manager.dirty:
+            self.metrics_manager.save_metrics()
@@ -68,21 +68,13 @@ class CollectNamespaceConfig(NamespaceMatcher):
     actions: Optional[Dict[CollectActions, CollectTaskConfig]] = None
 
     def model_post_init(self, _):
-        default_actions = {
-            action: CollectTaskConfig() for action in CollectActions
+        # Configured actions are already validated with their defaults
+        # filled in, so only the missing actions need a default config
+        actions = self.actions or {}
+        self.actions = {
+            action: actions.get(action) or CollectTaskConfig()
+            for action in CollectActions
         }
-        if self.actions is None:
-            self.actions = default_actions
-        else:
-            for action in CollectActions:
-                self.actions[action] = CollectTaskConfig(
-                    **{
-                        **CollectTaskConfig().model_dump(),
-                        **self.actions.get(
-                            action, CollectTaskConfig()
-                        ).model_dump(),
-                    }
-                )
 
 
 class PeopleAPIConfig(BaseModel):
@@ -5,10 +5,12 @@ other controllers
 
 import datetime
 import functools
+import threading
+import time
 import traceback
-from typing import Callable, List, Optional, TypeVar
+from typing import Any, Callable, List, Optional, TypeVar
 
-import wrapt
+from kubernetes.client import V1Namespace
 from pydantic import BaseModel
 
 from ska_ser_namespace_manager.controller.controller_config import (
@@ -17,12 +19,17 @@ from ska_ser_namespace_manager.controller.controller_config import (
 from ska_ser_namespace_manager.core.config import ConfigLoader
 from ska_ser_namespace_manager.core.kubernetes_api import KubernetesAPI
 from ska_ser_namespace_manager.core.logging import logging
-from ska_ser_namespace_manager.core.namespace import FORBIDDEN_NAMESPACES
+from ska_ser_namespace_manager.core.namespace import (
+    FORBIDDEN_NAMESPACES,
+    match_namespace,
+)
 from ska_ser_namespace_manager.core.template_factory import TemplateFactory
 from ska_ser_namespace_manager.core.thread_manager import ThreadManager
 
 T = TypeVar("T", bound=ControllerConfig)
 
+NAMESPACE_MATCH_CACHE_SIZE = 4096
+
 
 class Controller(KubernetesAPI, ThreadManager):
     """
@@ -31,7 +38,7 @@ class Controller(KubernetesAPI, ThreadManager):
     """
 
     config: BaseModel
-    forbidden_namespaces: list[str]
+    forbidden_namespaces: frozenset[str]
 
     def __init__(
         self,
@@ -50,107 +57,239 @@ class Controller(KubernetesAPI, ThreadManager):
         ThreadManager.__init__(self)
         self.config: T = ConfigLoader().load(config_class)
         self.template_factory = TemplateFactory()
-        self.forbidden_namespaces = FORBIDDEN_NAMESPACES + [
-            self.config.context.namespace
-        ]
+        self.forbidden_namespaces = FORBIDDEN_NAMESPACES.union(
+            [self.config.context.namespace]
+        )
+        self.namespace_match_cache: dict[str, tuple] = {}
+        self.task_wakeups: dict[str, threading.Event] = {}
         self.add_tasks(tasks)
 
+    def match_namespace_config(self, namespace: V1Namespace) -> Optional[Any]:
+        """
+        Match a namespace against the configured namespaces. Results are
+        cached by namespace uid until the namespace or the configuration
+        changes
+
+        :param namespace: Namespace to match
+        :return: The matching namespace configuration, if any
+        """
+        version = (
+            namespace.metadata.resource_version,
+            id(self.config.namespaces),
+        )
+        cached = self.namespace_match_cache.get(namespace.metadata.uid)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        ns_config = match_namespace(
+            self.config.namespaces, self.to_dto(namespace)
+        )
+        if len(self.namespace_match_cache) >= NAMESPACE_MATCH_CACHE_SIZE:
+            self.namespace_match_cache.clear()
+
+        self.namespace_match_cache[namespace.metadata.uid] = (
+            version,
+            ns_config,
+        )
+        return ns_config
+
+    def evict_namespace_match(self, namespace: V1Namespace) -> None:
+        """
+        Evict the cached configuration match of a namespace
+
+        :param namespace: Namespace to evict the match of
+        """
+        self.namespace_match_cache.pop(namespace.metadata.uid, None)
+
+    def wake_tasks(self) -> None:
+        """
+        Wake up the tasks backing off while idle, resetting their period
+        so that new work is picked up on their next regular tick
+        """
+        for wakeup in self.task_wakeups.values():
+            wakeup.set()
+
+
+def next_deadline(name: str, deadline: float, timeout: float) -> float:
+    """
+    Advance a task deadline by one period on the monotonic clock. Ticks
+    are scheduled at fixed offsets from the previous deadline so that
+    periods don't drift, and ticks missed while the task overran its
+    period are skipped. Tasks without a period just run again right away
+
+    :param name: Name of the task
+    :param deadline: Previous deadline
+    :param timeout: Period until the next tick, in seconds
+    :return: Next deadline
+    """
+    deadline += timeout
+    now = time.monotonic()
+    if deadline >= now:
+        return deadline
+
+    if timeout <= 0:
+        return now
+
+    missed = int((now - deadline) // timeout) + 1
+    logging.warning(
+        "Task '%s' overran its %.3fs period, skipping %s ticks",
+        name,
+        timeout,
+        missed,
+    )
+    return max(deadline + missed * timeout, now)
+
 
 def controller_task(
-    wrapped=None,
-    period: datetime.timedelta | Callable = datetime.timedelta(
+    *,
+    period: datetime.timedelta | Callable[[Any], float] = datetime.timedelta(
         milliseconds=1000
     ),
-):
+    max_period: datetime.timedelta | None = None,
+) -> Callable[[Callable], Callable]:
     """
-    controller_task decorator allows to wrap the looping behavior for tasks
+    controller_task decorator allows to wrap the looping behavior for tasks.
+    If max_period is set, the period doubles (up to max_period) every time
+    the task reports no work done by returning a falsy value, and resets
+    as soon as the task reports some work or the controller wakes its
+    tasks up
 
-    :param wrapped: Function wrapped with the decorator
-    :param period: Function calling period
-    :return: Wrapped function implementing a periodic call of a function
+    :param period: Function calling period, or a function of the
+    controller returning it in seconds
+    :param max_period: Maximum calling period when the task is idle
+    :return: Decorator wrapping a function into a periodic call of it
     """
-    if wrapped is None:
-        return functools.partial(controller_task, period=period)
-
-    @wrapt.decorator
-    def wrapper(wrapped, instance: Controller, args, kwargs):
-        while not instance.shutdown_event.is_set():
-            try:
-                logging.debug(f"Starting task {wrapped.__name__}")
-                wrapped(*args, **kwargs)
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                logging.error(
-                    "Failure in task '%s': %s", wrapped.__name__, exc
-                )
-                traceback.print_exception(exc)
+    period_seconds = (
+        period.total_seconds()
+        if isinstance(period, datetime.timedelta)
+        else None
+    )
+    max_period_seconds = (
+        max_period.total_seconds() if max_period is not None else None
+    )
+
+    def decorator(wrapped: Callable) -> Callable:
+        name = wrapped.__name__
 
-            if instance.shutdown_event.wait(
-                timeout=(
-                    period.total_seconds()
-                    if isinstance(period, datetime.timedelta)
+        @functools.wraps(wrapped)
+        def wrapper(instance: Controller, *args, **kwargs):
+            shutdown_event = instance.shutdown_event
+            wakeup = (
+                instance.task_wakeups.setdefault(name, threading.Event())
+                if max_period_seconds is not None
+                else None
+            )
+            idle_ticks = 0
+            deadline = time.monotonic()
+            while not shutdown_event.is_set():
+                if wakeup is not None:
+                    wakeup.clear()
+
+                try:
+                    logging.debug("Starting task %s", name)
+                    result = wrapped(instance, *args, **kwargs)
+                    idle_ticks = 0 if result else idle_ticks + 1
+                except (
+                    Exception  # pylint: disable=broad-exception-caught
+                ) as exc:
+                    logging.error("Failure in task '%s': %s", name, exc)
+                    traceback.print_exception(exc)
+                    idle_ticks = 0
+
+                base_timeout = (
+                    period_seconds
+                    if period_seconds is not None
                     else period(instance)
                 )
-            ):
-                logging.debug(f"Terminating task {wrapped.__name__}")
-                break
+                timeout = base_timeout
+                if max_period_seconds is not None and idle_ticks > 0:
+                    timeout = min(
+                        max_period_seconds,
+                        timeout * 2 ** min(idle_ticks, 16),
+                    )
 
-    return wrapper(wrapped)  # pylint: disable=no-value-for-parameter
+                deadline = next_deadline(name, deadline, timeout)
+                # Wait one base period at a time while backing off, so that
+                # a wakeup brings the task back to its regular period
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if shutdown_event.wait(
+                        timeout=min(remaining, base_timeout)
+                    ):
+                        logging.debug("Terminating task %s", name)
+                        return
+                    if remaining <= base_timeout:
+                        break
+                    if wakeup is not None and wakeup.is_set():
+                        logging.debug("Waking up task %s", name)
+                        idle_ticks = 0
+                        deadline = time.monotonic()
+                        break
+
+        return wrapper
+
+    return decorator
 
 
 def conditional_controller_task(
-    wrapped=None,
-    period: datetime.timedelta | Callable = datetime.timedelta(
+    *,
+    period: datetime.timedelta | Callable[[Any], float] = datetime.timedelta(
         milliseconds=1000
     ),
     run_if: Callable | bool | None = None,
-):
+) -> Callable[[Callable], Callable]:
     """
     ControllerTask decorator allows to wrap the looping behavior for tasks
 
-    :param wrapped: Function wrapped with the decorator
-    :param period: Function calling period
+    :param period: Function calling period, or a function of the
+    controller returning it in seconds
     :param run_if: Run function if True
-    :return: Wrapped function implementing a periodic call of a function
+    :return: Decorator wrapping a function into a periodic call of it
     """
-    if wrapped is None:
-        return functools.partial(
-            conditional_controller_task, period=period, run_if=run_if
-        )
+    period_seconds = (
+        period.total_seconds()
+        if isinstance(period, datetime.timedelta)
+        else None
+    )
+    if not callable(run_if):
+        run_always = run_if is None or bool(run_if)
 
-    @wrapt.decorator
-    def wrapper(wrapped, instance: Controller, args, kwargs):
-        while not instance.shutdown_event.is_set():
-            run: bool = True
-            if run_if is not None:
-                if callable(run_if):
-                    run = run_if(instance)
-                else:
-                    run = run_if
-
-            if run:
-                try:
-                    logging.debug(
-                        f"Starting conditional task {wrapped.__name__}"
-                    )
-                    wrapped(*args, **kwargs)
-                except (
-                    Exception  # pylint: disable=broad-exception-caught
-                ) as exc:
-                    logging.error(
-                        "Failure in task '%s': %s", wrapped.__name__, exc
-                    )
-                    traceback.print_exception(exc)
+        def constant_run_if(_) -> bool:
+            return run_always
 
-            if instance.shutdown_event.wait(
-                timeout=(
-                    period.total_seconds()
-                    if isinstance(period, datetime.timedelta)
-                    else period(instance)
-                )
-            ):
-                logging.debug(
-                    f"Terminating conditional task {wrapped.__name__}"
+        run_if = constant_run_if
+
+    def decorator(wrapped: Callable) -> Callable:
+        name = wrapped.__name__
+
+        @functools.wraps(wrapped)
+        def wrapper(instance: Controller, *args, **kwargs):
+            shutdown_event = instance.shutdown_event
+            deadline = time.monotonic()
+            while not shutdown_event.is_set():
+                if run_if(instance):
+                    try:
+                        logging.debug("Starting conditional task %s", name)
+                        wrapped(instance, *args, **kwargs)
+                    except (
+                        Exception  # pylint: disable=broad-exception-caught
+                    ) as exc:
+                        logging.error("Failure in task '%s': %s", name, exc)
+                        traceback.print_exception(exc)
+
+                deadline = next_deadline(
+                    name,
+                    deadline,
+                    (
+                        period_seconds
+                        if period_seconds is not None
+                        else period(instance)
+                    ),
                 )
-                break
+                if shutdown_event.wait(timeout=deadline - time.monotonic()):
+                    logging.debug("Terminating conditional task %s", name)
+                    break
+
+        return wrapper
 
-    return wrapper(wrapped)  # pylint: disable=no-value-for-parameter
+    return decorator
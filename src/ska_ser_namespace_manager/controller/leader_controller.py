@@ -3,7 +3,6 @@ leader_controller provides the a generic LeaderController class to build
 other controllers with leader election
 """
 
-import datetime
 from typing import Callable, List, Optional, TypeVar
 
 from ska_ser_namespace_manager.controller.controller import (
@@ -50,7 +49,7 @@ class LeaderController(Controller):
             )
             self.add_tasks([self.__acquire_lease])
 
-    def __acquire_lease_period(self) -> datetime.timedelta:
+    def __acquire_lease_period(self) -> float:
         return max(
             self.config.leader_election.lease_ttl.total_seconds() / 2, 0.5
         )
@@ -13,7 +13,7 @@ import yaml
 from pydantic import BaseModel
 
 from ska_ser_namespace_manager.core.logging import logging
-from ska_ser_namespace_manager.core.utils import Singleton
+from ska_ser_namespace_manager.core.utils import Singleton, YamlLoader
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -60,14 +60,14 @@ class ConfigLoader(metaclass=Singleton):
             )
             try:
                 with open(config_path, encoding="utf-8") as cf:
-                    config_data = yaml.safe_load(cf)
+                    config_data = yaml.load(cf, Loader=YamlLoader)
             except Exception:  # pylint: disable=broad-exception-caught
                 logging.warning(
                     "Failed to load config from file. Loading default config."
                 )
                 return clazz()
         elif isinstance(config_source, io.IOBase):
-            config_data = yaml.safe_load(config_source)
+            config_data = yaml.load(config_source, Loader=YamlLoader)
 
         if config_data is None:
             raise ValueError("Unable to load a valid configuration")
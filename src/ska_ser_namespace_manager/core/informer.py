@@ -0,0 +1,293 @@
+"""
+informer provides a watch-based cache of Kubernetes resources so that
+controllers can read the cluster state without listing it on every tick
+"""
+
+import threading
+import traceback
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from kubernetes import watch
+from kubernetes.client.exceptions import ApiException
+
+from ska_ser_namespace_manager.core.logging import logging
+
+WATCH_TIMEOUT_SECONDS = 10
+HTTP_STATUS_GONE = 410
+
+
+def label_index(label: str) -> Callable[[Any], Iterable[str]]:
+    """
+    Build an index function indexing resources by the value of a label
+
+    :param label: Label to index by
+    :return: Index function
+    """
+
+    def index_func(obj: Any) -> Iterable[str]:
+        value = (obj.metadata.labels or {}).get(label)
+        return () if value is None else (value,)
+
+    return index_func
+
+
+# The watch state, cache, indexes and handlers are updated together under
+# one lock, so they are kept as attributes of a single class
+class Informer:  # pylint: disable=too-many-instance-attributes
+    """
+    Informer lists a kind of resource once and keeps an in-memory copy of
+    it up to date by watching for changes from the last seen resource
+    version. Resources are listed from the API server watch cache, unless
+    the resource version expired, in which case they are listed again from
+    storage. Secondary indexes can be registered to look up resources by a
+    derived value. The generation counter is incremented on every change
+    to the cache. Event handlers can be registered to react to changes,
+    listed resources are handed to them as ADDED events. Informers are
+    callables so that they can be managed as tasks
+    """
+
+    def __init__(
+        self,
+        name: str,
+        list_func: Callable,
+        shutdown_event: threading.Event,
+        **list_kwargs,
+    ) -> None:
+        """
+        Initialize the Informer
+
+        :param name: Name of the informer task
+        :param list_func: Kubernetes API function to list the resources
+        :param shutdown_event: Event signaling the informer to stop
+        :param list_kwargs: Extra arguments to pass to list_func
+        """
+        self.__name__ = name
+        self.list_func = list_func
+        self.list_kwargs = list_kwargs
+        self.shutdown_event = shutdown_event
+        self.synced = threading.Event()
+        self.resource_version: Optional[str] = None
+        self.expired = False
+        self.generation = 0
+        self.__cache: Dict[str, Any] = {}
+        self.__indexers: Dict[str, Callable[[Any], Iterable[str]]] = {}
+        self.__indexes: Dict[str, Dict[str, Set[str]]] = {}
+        self.__handlers: List[Callable[[str, Any], None]] = []
+        self.__lock = threading.RLock()
+
+    @staticmethod
+    def key(obj: Any) -> str:
+        """
+        Get the cache key of a resource
+
+        :param obj: Kubernetes resource
+        :return: namespace/name for namespaced resources, name otherwise
+        """
+        if obj.metadata.namespace:
+            return f"{obj.metadata.namespace}/{obj.metadata.name}"
+
+        return obj.metadata.name
+
+    def add_index(
+        self, name: str, index_func: Callable[[Any], Iterable[str]]
+    ) -> None:
+        """
+        Register a secondary index
+
+        :param name: Name of the index
+        :param index_func: Function returning the index values of a resource
+        """
+        with self.__lock:
+            self.__indexers[name] = index_func
+            self.__indexes[name] = {}
+            for key, obj in self.__cache.items():
+                self.__index(name, key, obj)
+
+    def has_index(self, name: str) -> bool:
+        """
+        Check if a secondary index is registered
+
+        :param name: Name of the index
+        :return: True if the index exists, False otherwise
+        """
+        return name in self.__indexers
+
+    def by_index(self, name: str, value: str) -> List[Any]:
+        """
+        List the cached resources with a given index value
+
+        :param name: Name of the index
+        :param value: Index value to look up
+        :return: Resources with the index value
+        """
+        with self.__lock:
+            return [
+                self.__cache[key]
+                for key in sorted(self.__indexes[name].get(value, ()))
+            ]
+
+    def add_handler(self, handler: Callable[[str, Any], None]) -> None:
+        """
+        Register an event handler
+
+        :param handler: Function called with the event type and resource
+        """
+        self.__handlers.append(handler)
+
+    def __dispatch(self, event_type: str, obj: Any) -> None:
+        for handler in self.__handlers:
+            try:
+                handler(event_type, obj)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logging.error(
+                    "Failure in informer '%s' handler: %s", self.__name__, exc
+                )
+                traceback.print_exception(exc)
+
+    def __index(self, name: str, key: str, obj: Any) -> None:
+        for value in self.__indexers[name](obj):
+            self.__indexes[name].setdefault(value, set()).add(key)
+
+    def __unindex(self, name: str, key: str, obj: Any) -> None:
+        for value in self.__indexers[name](obj):
+            keys = self.__indexes[name].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.__indexes[name][value]
+
+    def __store(self, key: str, obj: Any) -> None:
+        self.__remove(key)
+        self.__cache[key] = obj
+        self.generation += 1
+        for name in self.__indexers:
+            self.__index(name, key, obj)
+
+    def __remove(self, key: str) -> None:
+        obj = self.__cache.pop(key, None)
+        if obj is not None:
+            self.generation += 1
+            for name in self.__indexers:
+                self.__unindex(name, key, obj)
+
+    def list(self) -> List[Any]:
+        """
+        List the cached resources
+
+        :return: Snapshot of the cached resources
+        """
+        with self.__lock:
+            return list(self.__cache.values())
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached resource
+
+        :param key: Cache key of the resource
+        :return: The resource if cached, None otherwise
+        """
+        with self.__lock:
+            return self.__cache.get(key)
+
+    def relist(self) -> None:
+        """
+        List the resources and replace the cache contents. Resources no
+        longer listed are dispatched as deleted
+        """
+        list_kwargs = dict(self.list_kwargs)
+        if not self.expired:
+            list_kwargs["resource_version"] = "0"
+
+        resources = self.list_func(**list_kwargs, _request_timeout=10)
+        with self.__lock:
+            previous = self.__cache
+            self.__cache = {}
+            self.__indexes = {name: {} for name in self.__indexers}
+            for obj in resources.items:
+                self.__store(self.key(obj), obj)
+
+            self.resource_version = resources.metadata.resource_version
+            self.expired = False
+            # Resources deleted while the watch was down produce no event
+            deleted = [
+                obj for key, obj in previous.items() if key not in self.__cache
+            ]
+
+        self.synced.set()
+        for obj in deleted:
+            self.__dispatch("DELETED", obj)
+
+        for obj in resources.items:
+            self.__dispatch("ADDED", obj)
+
+        logging.debug(
+            "Informer '%s' listed %s resources at version %s",
+            self.__name__,
+            len(resources.items),
+            self.resource_version,
+        )
+
+    def watch(self) -> None:
+        """
+        Watch the resources from the last seen resource version until the
+        watch times out or the informer is shut down
+        """
+        resource_watch = watch.Watch()
+        for event in resource_watch.stream(
+            self.list_func,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            _request_timeout=WATCH_TIMEOUT_SECONDS + 5,
+            **self.list_kwargs,
+        ):
+            event_type = event["type"]
+            obj = event["object"]
+            with self.__lock:
+                if event_type in ("ADDED", "MODIFIED"):
+                    self.__store(self.key(obj), obj)
+                elif event_type == "DELETED":
+                    self.__remove(self.key(obj))
+
+                self.resource_version = resource_watch.resource_version
+
+            if event_type in ("ADDED", "MODIFIED", "DELETED"):
+                self.__dispatch(event_type, obj)
+
+            if self.shutdown_event.is_set():
+                resource_watch.stop()
+
+    def __call__(self) -> None:
+        """
+        Keep the cache in sync until shutdown
+        """
+        while not self.shutdown_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self.relist()
+
+                self.watch()
+                continue
+            except ApiException as exc:
+                if exc.status == HTTP_STATUS_GONE:
+                    logging.info(
+                        "Informer '%s' resource version expired, relisting",
+                        self.__name__,
+                    )
+                    self.resource_version = None
+                    self.expired = True
+                    continue
+
+                logging.error(
+                    "Failure in informer '%s': %s", self.__name__, exc
+                )
+                traceback.print_exception(exc)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logging.error(
+                    "Failure in informer '%s': %s", self.__name__, exc
+                )
+                traceback.print_exception(exc)
+
+            self.shutdown_event.wait(timeout=1)
+
+        logging.debug("Terminating informer %s", self.__name__)
@@ -4,15 +4,97 @@ with a Kubernetes cluster. It offers methods for loading Kubernetes
 configurations and core namespace and resource management functionality
 """
 
+import functools
 import re
+import socket
 import traceback
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from kubernetes import client, config
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
+from ska_ser_namespace_manager.core.informer import Informer
 from ska_ser_namespace_manager.core.logging import logging
 from ska_ser_namespace_manager.core.namespace import Namespace
 
+API_CONNECTION_POOL_MAXSIZE = 32
+API_RETRIES = Retry(
+    total=5,
+    backoff_factor=0.1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    # Return the last response once retries run out, so that callers get an
+    # ApiException with its status rather than a MaxRetryError
+    raise_on_status=False,
+)
+# Probe idle connections after 30s, every 15s, 9 times, like client-go.
+# urllib3 replaces its default socket options rather than merging them
+API_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    *(
+        (socket.IPPROTO_TCP, getattr(socket, option), value)
+        for option, value in (
+            ("TCP_KEEPIDLE", 30),
+            ("TCP_KEEPINTVL", 15),
+            ("TCP_KEEPCNT", 9),
+        )
+        if hasattr(socket, option)
+    ),
+]
+APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+FIELD_MANAGER = "ska-namespace-manager"
+LITERAL_PATTERN = re.compile(r"[\w\-/ ]*")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_regex(pattern: str) -> re.Pattern:
+    """
+    Compile a regex pattern, memoizing the result
+
+    :param pattern: The regex pattern to compile
+    :return: The compiled pattern
+    """
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def is_literal_pattern(pattern: str) -> bool:
+    """
+    Check if a regex pattern has no special characters, in which case
+    matching it is equivalent to a prefix comparison
+
+    :param pattern: The regex pattern to check
+    :return: True if the pattern is a literal, False otherwise
+    """
+    return LITERAL_PATTERN.fullmatch(pattern) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_client(_kubeconfig: Optional[str] = None) -> client.ApiClient:
+    """
+    Get the shared API client. The client is created on first use from the
+    default configuration, which KubernetesAPI.load_kubeconfig loads
+    beforehand, and shared afterwards, so that all API instances share the
+    same connection pool. Pooled connections use TCP keepalive so that idle
+    ones, and long-lived watches, are not silently dropped. Failed requests
+    are retried with backoff, on methods urllib3 considers idempotent
+
+    :param _kubeconfig: Kubeconfig the default configuration was loaded
+    from, only used to key the cached client
+    :return: The shared API client
+    """
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = API_CONNECTION_POOL_MAXSIZE
+    configuration.retries = API_RETRIES
+    api_client = client.ApiClient(configuration)
+    # Not every supported client version reads socket options from the
+    # configuration, so they are set on the pool manager directly
+    api_client.rest_client.pool_manager.connection_pool_kw[
+        "socket_options"
+    ] = API_SOCKET_OPTIONS
+    return api_client
+
 
 class KubernetesAPI:
     """
@@ -20,6 +102,10 @@ class KubernetesAPI:
     Kubernetes configuration loading and basic operations.
     """
 
+    namespace_informer: Optional[Informer] = None
+    cronjob_informer: Optional[Informer] = None
+    job_informer: Optional[Informer] = None
+
     def __init__(self, kubeconfig: Optional[str] = None) -> None:
         """
         Initializes base config properties.
@@ -27,9 +113,10 @@ class KubernetesAPI:
         :return: None
         """
         self.load_kubeconfig(kubeconfig)
-        self.v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.batch_v1 = client.BatchV1Api()
+        self.api_client = get_api_client(kubeconfig)
+        self.v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        self.batch_v1 = client.BatchV1Api(self.api_client)
 
     def load_kubeconfig(self, kubeconfig: Optional[str] = None) -> None:
         """
@@ -67,11 +154,18 @@ class KubernetesAPI:
 
     def get_namespace(self, namespace: str) -> Optional[client.V1Namespace]:
         """
-        Gets namespace
+        Gets namespace. If a synced namespace informer is available, the
+        namespace is read from its cache
 
         :param namespace: The name of the namespace
         :return: The namespace object if found, else None
         """
+        if (
+            self.namespace_informer is not None
+            and self.namespace_informer.synced.is_set()
+        ):
+            return self.namespace_informer.get(namespace)
+
         logging.debug("Fetching namespace: %s", namespace)
         try:
             ns = self.v1.read_namespace(name=namespace, _request_timeout=10)
@@ -91,47 +185,173 @@ class KubernetesAPI:
         :param pattern: The regex pattern to match against
         :return: True if the value matches the pattern, False otherwise
         """
-        return re.match(pattern, value) is not None
+        if is_literal_pattern(pattern):
+            return value.startswith(pattern)
+
+        return compile_regex(pattern).match(value) is not None
+
+    def _build_label_selector(
+        self,
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
+        exclude_labels: Optional[Dict[str, str | Iterable[str]]] = None,
+    ) -> str:
+        """
+        Build a label selector from label filters. Values can be a single
+        value or a collection of values, in which case set-based
+        requirements are used
+
+        :param labels: Optional dictionary of labels to filter
+        :param exclude_labels: Optional dictionary of labels to exclude
+        :return: Label selector
+        """
+        requirements = []
+        for key, value in (labels or {}).items():
+            if isinstance(value, str):
+                requirements.append(f"{key}={value}")
+            else:
+                requirements.append(f"{key} in ({','.join(value)})")
+
+        for key, value in (exclude_labels or {}).items():
+            if isinstance(value, str):
+                requirements.append(f"{key}!={value}")
+            else:
+                requirements.append(f"{key} notin ({','.join(value)})")
+
+        return ",".join(requirements)
+
+    def _matches_labels(
+        self,
+        obj_labels: Dict[str, str],
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
+        exclude_labels: Optional[Dict[str, str | Iterable[str]]] = None,
+    ) -> bool:
+        """
+        Check if a set of labels matches label filters, with the same
+        semantics as the label selector built by _build_label_selector
+
+        :param obj_labels: Labels to check
+        :param labels: Optional dictionary of labels to filter
+        :param exclude_labels: Optional dictionary of labels to exclude
+        :return: True if the labels match the filters, False otherwise
+        """
+        for key, value in (labels or {}).items():
+            values = [value] if isinstance(value, str) else value
+            if key not in obj_labels or obj_labels[key] not in values:
+                return False
+
+        for key, value in (exclude_labels or {}).items():
+            values = [value] if isinstance(value, str) else value
+            if obj_labels.get(key) in values:
+                return False
+
+        return True
+
+    def _get_informer_candidates(
+        self,
+        informer: Informer,
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
+    ) -> List[Any]:
+        """
+        Get the cached resources that can match the label filters, using a
+        label index of the informer if there is one for a filtered label
+
+        :param informer: Informer to read resources from
+        :param labels: Optional dictionary of labels to filter
+        :return: Candidate resources
+        """
+        for key, value in (labels or {}).items():
+            if informer.has_index(key):
+                values = [value] if isinstance(value, str) else value
+                return [
+                    obj
+                    for index_value in dict.fromkeys(values)
+                    for obj in informer.by_index(key, index_value)
+                ]
+
+        return informer.list()
+
+    def _get_cached_resources(
+        self,
+        informer: Optional[Informer],
+        namespace: str,
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
+        exclude_labels: Optional[Dict[str, str | Iterable[str]]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        Get the resources of a namespace matching the label filters from
+        the cache of an informer, if it is synced and watches that namespace
+
+        :param informer: Informer to read resources from
+        :param namespace: Namespace of the resources
+        :param labels: Optional dictionary of labels to filter
+        :param exclude_labels: Optional dictionary of labels to exclude
+        :return: Matching resources, or None if the informer cannot be used
+        """
+        if (
+            informer is None
+            or not informer.synced.is_set()
+            or informer.list_kwargs.get("namespace") != namespace
+        ):
+            return None
+
+        return [
+            obj
+            for obj in self._get_informer_candidates(informer, labels)
+            if self._matches_labels(
+                obj.metadata.labels or {}, labels, exclude_labels
+            )
+        ]
 
     def get_namespaces_by(
         self,
-        labels: Optional[Dict[str, str]] = None,
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
         annotations: Optional[Dict[str, str]] = None,
-        exclude_labels: Optional[Dict[str, str]] = None,
+        exclude_labels: Optional[Dict[str, str | Iterable[str]]] = None,
         exclude_annotations: Optional[Dict[str, str]] = None,
     ) -> List[client.V1Namespace]:
         """
         List all namespaces with a given label, annotation, or combination of
         both, and optionally exclude namespaces with certain labels or
-        annotations.
+        annotations. Label filters are evaluated by the API server, unless
+        a synced namespace informer is available, in which case namespaces
+        are read from its cache. Lists are served from the API server watch
+        cache and can be slightly stale
 
         :param labels: Optional dictionary of labels to filter
-        namespaces (regex supported)
+        namespaces (a collection of values matches any of them)
         :param annotations: Optional dictionary of annotations to filter
         namespaces (regex supported)
         :param exclude_labels: Optional dictionary of labels to exclude
-        namespaces (regex supported)
+        namespaces (a collection of values matches any of them)
         :param exclude_annotations: Optional dictionary of annotations to
         exclude namespaces (regex supported)
         :return: List of namespaces matching the criteria
         """
         try:
-            label_selector = ""
-            if labels:
-                label_selector += ",".join(
-                    f"{key}={value}" for key, value in labels.items()
-                )
-
-            if exclude_labels:
-                if label_selector:
-                    label_selector += ","
-                label_selector += ",".join(
-                    f"{key}!={value}" for key, value in exclude_labels.items()
+            namespaces: List[client.V1Namespace]
+            if (
+                self.namespace_informer is not None
+                and self.namespace_informer.synced.is_set()
+            ):
+                namespaces = [
+                    ns
+                    for ns in self._get_informer_candidates(
+                        self.namespace_informer, labels
+                    )
+                    if self._matches_labels(
+                        ns.metadata.labels or {}, labels, exclude_labels
+                    )
+                ]
+            else:
+                label_selector = self._build_label_selector(
+                    labels, exclude_labels
                 )
+                namespaces = self.v1.list_namespace(
+                    label_selector=label_selector,
+                    resource_version="0",
+                    _request_timeout=10,
+                ).items
 
-            namespaces: List[client.V1Namespace] = self.v1.list_namespace(
-                label_selector=label_selector, _request_timeout=10
-            ).items
             filtered_namespaces = []
 
             for ns in namespaces:
@@ -202,19 +422,7 @@ class KubernetesAPI:
         :return: List of pods matching the criteria
         """
         try:
-            label_selector = ""
-            if labels:
-                label_selector += ",".join(
-                    f"{key}={value}" for key, value in labels.items()
-                )
-
-            if exclude_labels:
-                if label_selector:
-                    label_selector += ","
-                label_selector += ",".join(
-                    f"{key}!={value}" for key, value in exclude_labels.items()
-                )
-
+            label_selector = self._build_label_selector(labels, exclude_labels)
             pods: List[client.V1Pod] = self.v1.list_namespaced_pod(
                 namespace=namespace,
                 label_selector=label_selector,
@@ -252,7 +460,7 @@ class KubernetesAPI:
         namespace: str,
         labels: Optional[Dict[str, str]] = None,
         annotations: Optional[Dict[str, str]] = None,
-    ):
+    ) -> bool:
         """
         Patch the namespace with the provided labels and/or annotations.
 
@@ -261,7 +469,7 @@ class KubernetesAPI:
         with
         :param annotations: Optional dictionary of annotations to patch the
         namespace with
-        :return:
+        :return: True if the namespace was patched, False otherwise
         """
         logging.debug(
             "Patching namespace '%s' with labels '%s' and annotations '%s'",
@@ -280,9 +488,53 @@ class KubernetesAPI:
                 name=namespace, body=body, _request_timeout=10
             )
             logging.debug("Namespace %s patched successfully", namespace)
+            return True
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logging.error("Failed to patch namespace '%s': %s", namespace, exc)
             traceback.print_exception(exc)
+            return False
+
+    def apply_namespace(
+        self,
+        namespace: str,
+        labels: Optional[Dict[str, str]] = None,
+        annotations: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Apply the provided labels and/or annotations to the namespace using
+        server-side apply, owning them as the namespace manager. Failures
+        are raised so that callers can retry
+
+        :param namespace: The name of the namespace
+        :param labels: Optional dictionary of labels to apply
+        :param annotations: Optional dictionary of annotations to apply
+        :return:
+        """
+        logging.debug(
+            "Applying namespace '%s' with labels '%s' and annotations '%s'",
+            namespace,
+            labels,
+            annotations,
+        )
+        body = {
+            "apiVersion": "v1",
+            "kind": "Namespace",
+            "metadata": {"name": namespace},
+        }
+        if labels:
+            body["metadata"]["labels"] = labels
+        if annotations:
+            body["metadata"]["annotations"] = annotations
+
+        self.v1.patch_namespace(
+            name=namespace,
+            body=body,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+            _request_timeout=10,
+        )
+        logging.debug("Namespace %s applied successfully", namespace)
 
     def delete_namespace(self, namespace: str, grace_period: int = 0) -> None:
         """
@@ -309,17 +561,21 @@ class KubernetesAPI:
     def get_cronjobs_by(
         self,
         namespace: str,
-        labels: Optional[Dict[str, str]] = None,
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
         annotations: Optional[Dict[str, str]] = None,
-        exclude_labels: Optional[Dict[str, str]] = None,
+        exclude_labels: Optional[Dict[str, str | Iterable[str]]] = None,
         exclude_annotations: Optional[Dict[str, str]] = None,
     ) -> List[client.V1Namespace]:
         """
         List all cronjobs within a namespace given label, annotation, or
         combination of both, and optionally exclude cronjobs with certain
-        labels or annotations.
+        labels or annotations. Label filters are evaluated by the API server,
+        unless a synced cronjob informer watches the namespace, in which case
+        cronjobs are read from its cache. Lists are served from the API
+        server watch cache and can be slightly stale
 
         :param labels: Optional dictionary of labels to filter cronjobs
+        (a collection of values matches any of them)
         :param annotations: Optional dictionary of annotations to filter
         cronjobs
         :param exclude_labels: Optional dictionary of labels to exclude
@@ -329,25 +585,21 @@ class KubernetesAPI:
         :return: List of cronjobs matching the criteria
         """
         try:
-            label_selector = ""
-            if labels:
-                label_selector += ",".join(
-                    f"{key}={value}" for key, value in labels.items()
-                )
-
-            if exclude_labels:
-                if label_selector:
-                    label_selector += ","
-
-                label_selector += ",".join(
-                    f"{key}!={value}" for key, value in exclude_labels.items()
+            cronjobs: Optional[List[client.V1CronJob]] = (
+                self._get_cached_resources(
+                    self.cronjob_informer, namespace, labels, exclude_labels
                 )
-
-            cronjobs: List[client.V1CronJob] = (
-                self.batch_v1.list_namespaced_cron_job(
-                    namespace=namespace, _request_timeout=10
-                ).items
             )
+            if cronjobs is None:
+                cronjobs = self.batch_v1.list_namespaced_cron_job(
+                    namespace=namespace,
+                    label_selector=self._build_label_selector(
+                        labels, exclude_labels
+                    ),
+                    resource_version="0",
+                    _request_timeout=10,
+                ).items
+
             filtered_cronjobs = []
             for cronjob in cronjobs:
                 cronjob_annotations = cronjob.metadata.annotations or {}
@@ -375,17 +627,21 @@ class KubernetesAPI:
     def get_jobs_by(
         self,
         namespace: str,
-        labels: Optional[Dict[str, str]] = None,
+        labels: Optional[Dict[str, str | Iterable[str]]] = None,
         annotations: Optional[Dict[str, str]] = None,
-        exclude_labels: Optional[Dict[str, str]] = None,
+        exclude_labels: Optional[Dict[str, str | Iterable[str]]] = None,
         exclude_annotations: Optional[Dict[str, str]] = None,
     ) -> List[client.V1Namespace]:
         """
         List all jobs within a namespace given label, annotation, or
         combination of both, and optionally exclude jobs with certain
-        labels or annotations.
+        labels or annotations. Label filters are evaluated by the API server,
+        unless a synced job informer watches the namespace, in which case
+        jobs are read from its cache. Lists are served from the API server
+        watch cache and can be slightly stale
 
         :param labels: Optional dictionary of labels to filter jobs
+        (a collection of values matches any of them)
         :param annotations: Optional dictionary of annotations to filter
         jobs
         :param exclude_labels: Optional dictionary of labels to exclude
@@ -395,23 +651,18 @@ class KubernetesAPI:
         :return: List of jobs matching the criteria
         """
         try:
-            label_selector = ""
-            if labels:
-                label_selector += ",".join(
-                    f"{key}={value}" for key, value in labels.items()
-                )
-
-            if exclude_labels:
-                if label_selector:
-                    label_selector += ","
-
-                label_selector += ",".join(
-                    f"{key}!={value}" for key, value in exclude_labels.items()
-                )
-
-            jobs: List[client.V1Job] = self.batch_v1.list_namespaced_job(
-                namespace=namespace, _request_timeout=10
-            ).items
+            jobs: Optional[List[client.V1Job]] = self._get_cached_resources(
+                self.job_informer, namespace, labels, exclude_labels
+            )
+            if jobs is None:
+                jobs = self.batch_v1.list_namespaced_job(
+                    namespace=namespace,
+                    label_selector=self._build_label_selector(
+                        labels, exclude_labels
+                    ),
+                    resource_version="0",
+                    _request_timeout=10,
+                ).items
 
             filtered_jobs = []
             for job in jobs:
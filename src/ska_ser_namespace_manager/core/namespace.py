@@ -2,17 +2,20 @@
 namespace provides core namespace DTO and supporting functions
 """
 
+import functools
 import re
 from typing import Dict, List, Optional, TypeVar
 
 from pydantic import BaseModel
 
-FORBIDDEN_NAMESPACES = [
-    "kube-system",
-    "kube-public",
-    "kube-node-lease",
-    "default",
-]
+FORBIDDEN_NAMESPACES = frozenset(
+    [
+        "kube-system",
+        "kube-public",
+        "kube-node-lease",
+        "default",
+    ]
+)
 
 
 class Namespace(BaseModel):
@@ -60,6 +63,13 @@ class NamespaceMatcher(BaseModel):
     any: Optional[List[NamespaceMatchingOptions]] = None
     all: Optional[List[NamespaceMatchingOptions]] = None
 
+    @functools.cached_property
+    def name_patterns(self) -> tuple[re.Pattern, ...]:
+        """
+        Compiled names patterns, compiled on first use
+        """
+        return tuple(re.compile(pattern) for pattern in self.names or ())
+
 
 T = TypeVar("T", bound=NamespaceMatcher)
 
@@ -103,7 +113,8 @@ def match_namespace(configs: List[T], namespace: Namespace) -> T | None:
         score = 0
         if config.names:
             name_match = any(
-                re.match(pattern, namespace.name) for pattern in config.names
+                pattern.match(namespace.name)
+                for pattern in config.name_patterns
             )
             if name_match:
                 score += 1
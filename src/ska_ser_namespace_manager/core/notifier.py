@@ -4,16 +4,39 @@ namespace manager can use to notify the namespace owners about actions
 taken on their namespaces
 """
 
+import queue
 import random
+import threading
+import time
 import traceback
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
 
 from slack_bolt.app import App
+from slack_sdk.errors import SlackApiError
 
 from ska_ser_namespace_manager.core.logging import logging
 from ska_ser_namespace_manager.core.template_factory import TemplateFactory
 from ska_ser_namespace_manager.core.types import NamespaceStatus
 from ska_ser_namespace_manager.core.utils import decode_slack_address
 
+NOTIFICATION_INTERVAL = 1.0
+NOTIFICATION_MAX_ATTEMPTS = 5
+HTTP_STATUS_TOO_MANY_REQUESTS = 429
+
+
+class Notification(NamedTuple):
+    """
+    Notification holds a queued user notification
+    """
+
+    address: str
+    template: str
+    status: str
+    kwargs: Dict[str, Any]
+    key: Optional[Hashable] = None
+    callback: Optional[Callable[[], bool]] = None
+    attempt: int = 0
+
 
 class Notifier:
     """
@@ -25,7 +48,14 @@ class Notifier:
     template_factory: TemplateFactory
 
     def __init__(self, slack_token: str):
-        self.template_factory = TemplateFactory()
+        if getattr(self, "template_factory", None) is None:
+            self.template_factory = TemplateFactory()
+
+        self.notification_queue: queue.Queue[Notification] = queue.Queue()
+        self.pending_notifications: set[Hashable] = set()
+        self.pending_notifications_lock = threading.Lock()
+        self.last_notified_at: Dict[str, float] = {}
+        self.notifications_paused_until = 0.0
         if not slack_token:
             logging.warning(
                 "Slack bot token is not configured, notifications"
@@ -35,8 +65,134 @@ class Notifier:
         else:
             self.slack_client = App(token=slack_token)
 
+    def queue_notification(
+        self,
+        address: str,
+        template: str,
+        status: str,
+        key: Optional[Hashable] = None,
+        callback: Optional[Callable[[], bool]] = None,
+        **kwargs,
+    ) -> bool:
+        """
+        Queues a user notification to be sent by process_notifications
+
+        :param address: Slack address, encoded by encode_slack_address
+        :param template: Template to use
+        :param status: Status the resource is at
+        :param key: Optional key identifying the notification. Notifications
+        with the same key as a pending one are not queued
+        :param callback: Optional function to call once the notification
+        is sent. If it returns True, the notification key stays pending
+        until released with release_notification
+        :param kwargs: Arguments to pass to the template
+        :return: True if the notification was queued, false otherwise
+        """
+        if not self.slack_client:
+            return False
+
+        if key is not None:
+            with self.pending_notifications_lock:
+                if key in self.pending_notifications:
+                    return False
+
+                self.pending_notifications.add(key)
+
+        self.notification_queue.put(
+            Notification(address, template, status, kwargs, key, callback)
+        )
+        return True
+
+    def release_notification(self, key: Hashable) -> None:
+        """
+        Releases the key of a pending notification, so that notifications
+        with the same key can be queued again
+
+        :param key: Key of the notification
+        """
+        with self.pending_notifications_lock:
+            self.pending_notifications.discard(key)
+
+    def process_notifications(self) -> int:
+        """
+        Sends the queued notifications, sending at most one notification
+        per NOTIFICATION_INTERVAL to the same address and backing off when
+        slack rate limits the requests
+
+        :return: Number of notifications sent
+        """
+        sent = 0
+        deferred = []
+        while True:
+            try:
+                notification = self.notification_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            now = time.monotonic()
+            if now < self.notifications_paused_until or (
+                now - self.last_notified_at.get(notification.address, 0.0)
+                < NOTIFICATION_INTERVAL
+            ):
+                deferred.append(notification)
+                continue
+
+            self.last_notified_at[notification.address] = now
+            try:
+                success = self.notify_user(
+                    notification.address,
+                    notification.template,
+                    notification.status,
+                    raise_on_rate_limit=True,
+                    **notification.kwargs,
+                )
+            except SlackApiError as exc:
+                retry_after = next(
+                    (
+                        value
+                        for name, value in exc.response.headers.items()
+                        if name.lower() == "retry-after"
+                    ),
+                    None,
+                )
+                self.notifications_paused_until = time.monotonic() + (
+                    float(retry_after)
+                    if retry_after
+                    else 2**notification.attempt
+                )
+                logging.warning(
+                    "Slack rate limited notifications, pausing for %.0fs",
+                    self.notifications_paused_until - time.monotonic(),
+                )
+                if notification.attempt + 1 < NOTIFICATION_MAX_ATTEMPTS:
+                    deferred.append(
+                        notification._replace(attempt=notification.attempt + 1)
+                    )
+                    continue
+
+                success = False
+
+            keep_pending = False
+            if success:
+                sent += 1
+                if notification.callback is not None:
+                    keep_pending = notification.callback()
+
+            if notification.key is not None and not keep_pending:
+                self.release_notification(notification.key)
+
+        for notification in deferred:
+            self.notification_queue.put(notification)
+
+        return sent
+
     def notify_user(
-        self, address: str, template: str, status: str, **kwargs
+        self,
+        address: str,
+        template: str,
+        status: str,
+        raise_on_rate_limit: bool = False,
+        **kwargs,
     ) -> bool:
         """
         Notifies a user that some action is to be or was taken using slack
@@ -45,6 +201,8 @@ class Notifier:
         :param address: Slack address, encoded by encode_slack_address
         :param template: Template to use
         :param status: Status the resource is at
+        :param raise_on_rate_limit: Raise the SlackApiError if slack rate
+        limits the request instead of failing the notification
         :param kwargs: Arguments to pass to the template
         :return: True if the notification was sent, false otherwise
         """
@@ -65,9 +223,19 @@ class Notifier:
                     user=user,
                     status=status,
                     quote=self.get_marvin_quote(status),
-                    **kwargs
+                    **kwargs,
                 ),
             )
+        except SlackApiError as exc:
+            if (
+                raise_on_rate_limit
+                and exc.response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS
+            ):
+                raise
+
+            logging.error("Failed to notify user '%s':", exc)
+            traceback.print_exception(exc)
+            return False
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logging.error("Failed to notify user '%s':", exc)
             traceback.print_exception(exc)
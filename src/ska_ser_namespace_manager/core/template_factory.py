@@ -43,7 +43,9 @@ class TemplateFactory:
                         "templates",
                     )
                 )
-            )
+            ),
+            auto_reload=False,
+            cache_size=-1,
         )
         self.jinja_env.filters["sha256"] = sha256
 
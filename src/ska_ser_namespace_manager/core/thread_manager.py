@@ -5,7 +5,6 @@ thread_manager provides a central way of managing threaded tasks
 import logging
 import signal
 import threading
-from collections import defaultdict
 from typing import Callable, List, TypeVar
 
 T = TypeVar("T")
@@ -21,7 +20,8 @@ class ThreadManager:
         Initialize the ThreadManager.
         """
         self.shutdown_event = threading.Event()
-        self.threads = defaultdict(threading.Thread)
+        self.shutdown_signal: int | None = None
+        self.threads: dict[str, threading.Thread] = {}
         signal.signal(signal.SIGINT, self.__shutdown)
         signal.signal(signal.SIGTERM, self.__shutdown)
 
@@ -43,12 +43,14 @@ class ThreadManager:
         self, signum: int, frame  # pylint: disable=unused-argument
     ) -> None:
         """
-        Handle the shutdown signal.
+        Handle the shutdown signal. Signal handlers interrupt the main
+        thread at any point, so the signal is only recorded here and
+        logged once the tasks are stopped
 
         :param signum: Signal number
         :param frame: Current stack frame
         """
-        logging.info("Received shutdown signal: %s [%s]", signum, frame)
+        self.shutdown_signal = signum
         self.shutdown_event.set()
 
     def run(self, blocking: bool = True) -> None:
@@ -73,3 +75,9 @@ class ThreadManager:
             if thread.is_alive():
                 thread.join()
                 logging.debug("Thread for task '%s' completed", task)
+
+        if self.shutdown_signal is not None:
+            logging.info(
+                "Stopped after receiving shutdown signal: %s",
+                signal.Signals(self.shutdown_signal).name,
+            )
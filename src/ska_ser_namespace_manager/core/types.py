@@ -40,6 +40,22 @@ class NamespaceAnnotations(str, Enum):
     FAILING_RESOURCES = "manager.cicd.skao.int/failing_resources"
     NOTIFIED_TS = "manager.cicd.skao.int/notified_timestamp"
     NOTIFIED_STATUS = "manager.cicd.skao.int/notified_status"
+    SPEC_HASH = "manager.cicd.skao.int/spec_hash"
+
+    def __str__(self):
+        return self.value
+
+
+class NamespaceLabels(str, Enum):
+    """
+    NamespaceLabels describes the labels mirroring annotations that are
+    used to select namespaces and collection resources server-side
+    """
+
+    MANAGED = "manager.cicd.skao.int/managed"
+    NAMESPACE = "manager.cicd.skao.int/namespace"
+    ACTION = "manager.cicd.skao.int/action"
+    STATUS = "manager.cicd.skao.int/status"
 
     def __str__(self):
         return self.value
@@ -4,13 +4,18 @@ utils provides utility classes and functions
 
 import base64
 import datetime
+import hashlib
 import json
 import re
 from typing import Any, Tuple
 
 import pytz
+import yaml
+from pydantic import BaseModel
 from starlette.requests import Request
 
+from ska_ser_namespace_manager.core.logging import logging
+
 UNITS = {
     "s": "seconds",
     "m": "minutes",
@@ -18,6 +23,8 @@ UNITS = {
     "d": "days",
     "w": "weeks",
 }
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class Singleton(type):
@@ -121,3 +128,27 @@ def decode_slack_address(address: str) -> Tuple[str, str]:
         return None, None
 
     return tuple(base64.b64decode(address).decode("utf-8").split("::"))
+
+
+def spec_hash(spec: str) -> str:
+    """
+    Computes a short digest of a rendered resource spec
+
+    :param spec: Rendered spec to hash
+    :return: Hex digest of the spec
+    """
+    return hashlib.blake2b(spec.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def log_config(config: BaseModel) -> None:
+    """
+    Logs a configuration as YAML, only serializing it if debug logging
+    is enabled
+
+    :param config: Configuration to log
+    """
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(
+            "Configuration: \n%s",
+            yaml.dump(config.model_dump(mode="json"), Dumper=YamlDumper),
+        )
@@ -3,7 +3,7 @@ Module for managing the metrics reported by the Prometheus Exporter.
 """
 
 import os
-from typing import Dict
+from typing import Callable, Dict, Iterable, Tuple
 
 from kubernetes.client import V1Namespace
 from prometheus_client import (
@@ -22,14 +22,26 @@ from ska_ser_namespace_manager.core.types import (
 )
 from ska_ser_namespace_manager.metrics.metrics_config import MetricsConfig
 
+NS_STATUS_LABELS = (
+    ("environment", CicdAnnotations.ENV_TIER.value),
+    ("project", CicdAnnotations.PROJECT.value),
+    ("team", CicdAnnotations.TEAM.value),
+    ("user", CicdAnnotations.AUTHOR.value),
+    ("pipelineId", CicdAnnotations.PIPELINE_ID.value),
+    ("projectId", CicdAnnotations.PROJECT_ID.value),
+)
+
 
 class MetricsManager:
     """Singleton class that groups all the metrics."""
 
     metrics: Dict[str, Collector]
+    status_children: Dict[Tuple[str, ...], Gauge]
+    dirty: bool
 
     def __init__(self, config: MetricsConfig):
         self.config = config
+        self.dirty = False
         logging.info("Metrics regsitry at: %s", self.config.registry_path)
 
         if not os.path.exists(self.config.registry_path):
@@ -40,23 +52,38 @@ class MetricsManager:
         )
         self.load_metrics()
 
-    def delete_stale_metrics(self, namespaces: list[str]):
+    def delete_stale_metrics(self, namespaces: Iterable[str]):
         """
         Delete metrics on namespaces that no longer exist
 
         :param namespaces: Existing namespaces
         """
-        for (
-            sample
-        ) in (
-            self.namespace_manager_ns_status._samples()  # pylint: disable=line-too-long,protected-access  # noqa: E501
-        ):
-            namespace = sample.labels.get("namespace")
-            if namespace not in namespaces:
-                logging.info("Removed metrics for namespace '%s'", namespace)
-                self.namespace_manager_ns_status.remove(
-                    *sample.labels.values()
-                )
+        active_namespaces = frozenset(namespaces)
+        self.__delete_metrics(lambda name: name not in active_namespaces)
+
+    def delete_namespaces_metrics(self, namespaces: Iterable[str]):
+        """
+        Delete the metrics of the given namespaces
+
+        :param namespaces: Namespaces to delete metrics on
+        """
+        deleted_namespaces = frozenset(namespaces)
+        if deleted_namespaces:
+            self.__delete_metrics(lambda name: name in deleted_namespaces)
+
+    def __delete_metrics(self, is_stale: Callable[[str], bool]):
+        stale_samples = [
+            sample.labels
+            for sample in self.namespace_manager_ns_status._samples()  # pylint: disable=protected-access  # noqa: E501
+            if is_stale(sample.labels.get("namespace"))
+        ]
+        for labels in stale_samples:
+            logging.info(
+                "Removed metrics for namespace '%s'", labels.get("namespace")
+            )
+            self.namespace_manager_ns_status.remove(*labels.values())
+            self.status_children.pop(tuple(labels.values()), None)
+            self.dirty = True
 
     def update_namespace_metrics(self, namespace: V1Namespace):
         """
@@ -64,27 +91,42 @@ class MetricsManager:
 
         :param namespace: Namespace to update metrics on
         """
-        labels = namespace.metadata.labels or {}
-        annotations = namespace.metadata.annotations or {}
-        status = annotations.get(NamespaceAnnotations.STATUS.value, "unknown")
-        status_numeric = NamespaceStatus.from_string(status).value_numeric
-
-        self.namespace_manager_ns_status.labels(
-            environment=labels.get(CicdAnnotations.ENV_TIER.value, "unknown"),
-            project=labels.get(CicdAnnotations.PROJECT.value, "unknown"),
-            team=labels.get(CicdAnnotations.TEAM.value, "unknown"),
-            user=labels.get(CicdAnnotations.AUTHOR.value, "unknown"),
-            pipelineId=labels.get(
-                CicdAnnotations.PIPELINE_ID.value, "unknown"
-            ),
-            projectId=labels.get(CicdAnnotations.PROJECT_ID.value, "unknown"),
-            namespace=namespace.metadata.name,
-        ).set(status_numeric)
+        self.update_namespaces_metrics([namespace])
 
-        logging.debug(
-            f"Updated metrics for namespace '{namespace.metadata.name}' - "
-            f"Status: {status}"
-        )
+    def update_namespaces_metrics(self, namespaces: Iterable[V1Namespace]):
+        """
+        Update the metrics of a batch of namespaces
+
+        :param namespaces: Namespaces to update metrics on
+        """
+        status_children = self.status_children
+        status_gauge = self.namespace_manager_ns_status
+        updated = 0
+        for namespace in namespaces:
+            labels = namespace.metadata.labels or {}
+            annotations = namespace.metadata.annotations or {}
+            status = annotations.get(
+                NamespaceAnnotations.STATUS.value, "unknown"
+            )
+            label_values = (
+                *(labels.get(key, "unknown") for _, key in NS_STATUS_LABELS),
+                namespace.metadata.name,
+            )
+            child = status_children.get(label_values)
+            if child is None:
+                child = status_gauge.labels(*label_values)
+                status_children[label_values] = child
+
+            child.set(NamespaceStatus.from_string(status).value_numeric)
+            updated += 1
+            logging.debug(
+                "Updated metrics for namespace '%s' - Status: %s",
+                namespace.metadata.name,
+                status,
+            )
+
+        if updated:
+            self.dirty = True
 
     def get_metrics(self) -> None:
         """
@@ -109,6 +151,7 @@ class MetricsManager:
         that Prometheus can read.
         """
         logging.debug("Saving prometheus metrics to '%s'", self.metrics_file)
+        self.dirty = False
         write_to_textfile(self.metrics_file, self.registry)
 
     def load_metrics(self):
@@ -119,18 +162,11 @@ class MetricsManager:
         metrics with the values from the file.
         """
         self.registry = CollectorRegistry()
+        self.status_children = {}
         self.namespace_manager_ns_status = Gauge(
             name="namespace_manager_ns_status",
             documentation="Namespace status",
-            labelnames=[
-                "environment",
-                "project",
-                "team",
-                "user",
-                "pipelineId",
-                "projectId",
-                "namespace",
-            ],
+            labelnames=[name for name, _ in NS_STATUS_LABELS] + ["namespace"],
             registry=self.registry,
         )
 
@@ -162,11 +198,13 @@ class MetricsManager:
                             if gauge and isinstance(gauge, Gauge):
                                 gauge.labels(**label_dict).set(value)
                                 logging.debug(
-                                    f"Set {name} with labels "
-                                    f"{label_dict} to {value}"
+                                    "Set %s with labels %s to %s",
+                                    name,
+                                    label_dict,
+                                    value,
                                 )
                             else:
                                 logging.warning(
-                                    "Unrecognized or unsupported "
-                                    f"metric: {name}"
+                                    "Unrecognized or unsupported metric: %s",
+                                    name,
                                 )
@@ -1,3 +1,4 @@
+import threading
 from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +9,8 @@ from ska_ser_namespace_manager.controller.action_controller import (
 )
 from ska_ser_namespace_manager.controller.action_controller_config import (
     ActionControllerConfig,
+    ActionNamespaceConfig,
+    ActionNamespacePhaseConfig,
 )
 from ska_ser_namespace_manager.controller.leader_controller import (
     LeaderController,
@@ -16,6 +19,7 @@ from ska_ser_namespace_manager.core.namespace import Namespace
 from ska_ser_namespace_manager.core.notifier import Notifier
 from ska_ser_namespace_manager.core.types import (
     NamespaceAnnotations,
+    NamespaceLabels,
     NamespaceStatus,
 )
 
@@ -87,8 +91,7 @@ def action_controller(
             action_controller_instance,
             ActionControllerConfig,
             [
-                action_controller_instance.delete_stale_namespaces,
-                action_controller_instance.delete_failed_namespaces,
+                action_controller_instance.delete_terminal_namespaces,
             ],
             None,
         )
@@ -98,6 +101,9 @@ def action_controller(
         )
 
         action_controller_instance.forbidden_namespaces = []
+        action_controller_instance.namespace_match_cache = {}
+        action_controller_instance.task_wakeups = {}
+        action_controller_instance.slack_client = MagicMock()
         action_controller_instance.config = mock_action_controller_config
         action_controller_instance.leader_lock = MagicMock()
         action_controller_instance.shutdown_event = MagicMock()
@@ -117,9 +123,9 @@ def test_action_controller_init(
     ) as mock_config_loader, patch(
         "ska_ser_namespace_manager.core.logging.logging.debug"
     ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.yaml.safe_dump"
+        "ska_ser_namespace_manager.core.utils.yaml.safe_dump"
     ) as mock_yaml_dump, patch(
-        "ska_ser_namespace_manager.controller.action_controller.yaml.safe_load"
+        "ska_ser_namespace_manager.core.utils.yaml.safe_load"
     ) as mock_yaml_load, patch.object(
         LeaderController, "__init__", return_value=None
     ) as mock_leader_init, patch.object(
@@ -139,8 +145,7 @@ def test_action_controller_init(
             action_controller_instance,
             ActionControllerConfig,
             [
-                action_controller_instance.delete_stale_namespaces,
-                action_controller_instance.delete_failed_namespaces,
+                action_controller_instance.delete_terminal_namespaces,
             ],
             None,
         )
@@ -167,8 +172,7 @@ def test_action_controller_init(
             action_controller_instance,
             ActionControllerConfig,
             [
-                action_controller_instance.delete_stale_namespaces,
-                action_controller_instance.delete_failed_namespaces,
+                action_controller_instance.delete_terminal_namespaces,
             ],
             None,
         )
@@ -178,18 +182,30 @@ def test_action_controller_init(
         )
 
 
-def test_delete_namespaces_with_status_no_match(action_controller):
+def test_action_namespace_config_phase_config():
+    stale = ActionNamespacePhaseConfig(delete=False)
+    ns_config = ActionNamespaceConfig(stale=stale)
+    assert ns_config.get_phase_config(NamespaceStatus.STALE.value) == stale
+    assert ns_config.get_phase_config(NamespaceStatus.FAILING.value) == (
+        ns_config.failing
+    )
+    assert ns_config.get_phase_config(NamespaceStatus.OK.value) is None
+
+
+def test_delete_namespaces_with_statuses_no_match(action_controller):
     action_controller.get_namespaces_by = MagicMock(return_value=[])
-    action_controller.delete_namespaces_with_status("stale")
+    action_controller.delete_namespaces_with_statuses(
+        frozenset([NamespaceStatus.STALE.value])
+    )
     action_controller.get_namespaces_by.assert_called_once_with(
-        annotations={
-            NamespaceAnnotations.MANAGED.value: "true",
-            NamespaceAnnotations.STATUS.value: NamespaceStatus.STALE.value,
+        labels={
+            NamespaceLabels.MANAGED.value: "true",
+            NamespaceLabels.STATUS.value: [NamespaceStatus.STALE.value],
         }
     )
 
 
-def test_delete_namespaces_with_status_match(action_controller):
+def test_delete_namespaces_with_statuses_match(action_controller):
     mock_namespace = MagicMock()
     mock_namespace.metadata.name = "test-namespace"
     mock_namespace.metadata.annotations = {
@@ -210,30 +226,29 @@ def test_delete_namespaces_with_status_match(action_controller):
         )
     )
     action_controller.delete_namespace = MagicMock()
-    action_controller.notify_user = MagicMock()
+    action_controller.queue_notification = MagicMock()
 
     phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
     phase_config.delete = True
     phase_config.notify_on_delete = True
 
     with patch(
-        "ska_ser_namespace_manager.controller.action_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
-        return_value=True,
-    ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.getattr",
-        return_value=phase_config,
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
     ):
-        action_controller.delete_namespaces_with_status(
-            NamespaceStatus.STALE.value
+        action_controller.delete_namespaces_with_statuses(
+            frozenset([NamespaceStatus.STALE.value])
         )
 
     action_controller.delete_namespace.assert_called_once_with(
         "test-namespace"
     )
-    action_controller.notify_user.assert_called_once()
+    action_controller.queue_notification.assert_called_once()
 
 
-def test_delete_namespaces_with_status_match_no_notify(action_controller):
+def test_delete_namespaces_with_statuses_match_no_notify(action_controller):
     mock_namespace = MagicMock()
     mock_namespace.metadata.name = "test-namespace"
     mock_namespace.metadata.annotations = {
@@ -252,28 +267,29 @@ def test_delete_namespaces_with_status_match_no_notify(action_controller):
         )
     )
     action_controller.delete_namespace = MagicMock()
-    action_controller.notify_user = MagicMock()
+    action_controller.queue_notification = MagicMock()
 
     phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
     phase_config.delete = True
     phase_config.notify_on_delete = False
 
     with patch(
-        "ska_ser_namespace_manager.controller.action_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
-        return_value=True,
-    ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.getattr",
-        return_value=phase_config,
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
     ):
-        action_controller.delete_namespaces_with_status("stale")
+        action_controller.delete_namespaces_with_statuses(
+            frozenset([NamespaceStatus.STALE.value])
+        )
 
     action_controller.delete_namespace.assert_called_once_with(
         "test-namespace"
     )
-    action_controller.notify_user.assert_not_called()
+    action_controller.queue_notification.assert_not_called()
 
 
-def test_delete_namespaces_with_status_match_no_delete(action_controller):
+def test_delete_namespaces_with_statuses_match_no_delete(action_controller):
     mock_namespace = MagicMock()
     mock_namespace.metadata.name = "test-namespace"
     mock_namespace.metadata.annotations = {
@@ -292,26 +308,27 @@ def test_delete_namespaces_with_status_match_no_delete(action_controller):
         )
     )
     action_controller.delete_namespace = MagicMock()
-    action_controller.notify_user = MagicMock()
+    action_controller.queue_notification = MagicMock()
 
     phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
     phase_config.delete = False
     phase_config.notify_on_delete = False
 
     with patch(
-        "ska_ser_namespace_manager.controller.action_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
-        return_value=True,
-    ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.getattr",
-        return_value=phase_config,
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
     ):
-        action_controller.delete_namespaces_with_status("stale")
+        action_controller.delete_namespaces_with_statuses(
+            frozenset([NamespaceStatus.STALE.value])
+        )
 
     action_controller.delete_namespace.assert_not_called()
-    action_controller.notify_user.assert_not_called()
+    action_controller.queue_notification.assert_not_called()
 
 
-def test_delete_namespaces_with_status_terminating(action_controller):
+def test_delete_namespaces_with_statuses_terminating(action_controller):
     mock_namespace = MagicMock()
     mock_namespace.metadata.name = "test-namespace"
     mock_namespace.metadata.annotations = {
@@ -332,40 +349,87 @@ def test_delete_namespaces_with_status_terminating(action_controller):
         )
     )
     action_controller.delete_namespace = MagicMock()
-    action_controller.notify_user = MagicMock()
+    action_controller.queue_notification = MagicMock()
 
     phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
     phase_config.delete = True
     phase_config.notify_on_delete = True
 
     with patch(
-        "ska_ser_namespace_manager.controller.action_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
-        return_value=True,
-    ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.getattr",
-        return_value=phase_config,
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
     ):
-        action_controller.delete_namespaces_with_status(
-            NamespaceStatus.STALE.value
+        action_controller.delete_namespaces_with_statuses(
+            frozenset([NamespaceStatus.STALE.value])
         )
 
     action_controller.delete_namespace.assert_not_called()
-    action_controller.notify_user.assert_not_called()
+    action_controller.queue_notification.assert_not_called()
 
 
-def test_delete_stale_namespaces(action_controller):
-    action_controller.delete_namespaces_with_status = MagicMock()
-    action_controller.delete_stale_namespaces()
-    action_controller.delete_namespaces_with_status.assert_called_once_with(
-        NamespaceStatus.STALE.value
+def test_delete_namespaces_with_statuses(action_controller):
+    stale_namespace = MagicMock()
+    stale_namespace.metadata.name = "stale-namespace"
+    stale_namespace.metadata.annotations = {
+        NamespaceAnnotations.STATUS.value: NamespaceStatus.STALE.value
+    }
+    stale_namespace.status.phase = "Active"
+    failed_namespace = MagicMock()
+    failed_namespace.metadata.name = "failed-namespace"
+    failed_namespace.metadata.annotations = {
+        NamespaceAnnotations.STATUS.value: NamespaceStatus.FAILED.value
+    }
+    failed_namespace.status.phase = "Active"
+
+    action_controller.get_namespaces_by = MagicMock(
+        return_value=[stale_namespace, failed_namespace]
     )
+    action_controller.to_dto = MagicMock()
+    action_controller.delete_namespace = MagicMock()
+    action_controller.queue_notification = MagicMock()
+
+    phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
+    phase_config.delete = True
+    phase_config.notify_on_delete = False
 
+    with patch(
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
+    ):
+        deleted = action_controller.delete_namespaces_with_statuses(
+            frozenset(
+                [NamespaceStatus.STALE.value, NamespaceStatus.FAILED.value]
+            )
+        )
 
-def test_delete_failed_namespaces(action_controller):
-    action_controller.delete_namespaces_with_status = MagicMock()
-    action_controller.delete_failed_namespaces()
-    action_controller.delete_namespaces_with_status.assert_called_once_with(
-        NamespaceStatus.FAILED.value
+    assert deleted == 2
+    action_controller.get_namespaces_by.assert_called_once_with(
+        labels={
+            NamespaceLabels.MANAGED.value: "true",
+            NamespaceLabels.STATUS.value: [
+                NamespaceStatus.FAILED.value,
+                NamespaceStatus.STALE.value,
+            ],
+        }
+    )
+    assert [
+        call.args[0] for call in ns_config.get_phase_config.call_args_list
+    ] == [
+        NamespaceStatus.STALE.value,
+        NamespaceStatus.FAILED.value,
+    ]
+    assert action_controller.delete_namespace.call_count == 2
+
+
+def test_delete_terminal_namespaces(action_controller):
+    action_controller.delete_namespaces_with_statuses = MagicMock()
+    action_controller.delete_terminal_namespaces()
+    action_controller.delete_namespaces_with_statuses.assert_called_once_with(
+        frozenset([NamespaceStatus.STALE.value, NamespaceStatus.FAILED.value])
     )
 
 
@@ -373,15 +437,25 @@ def test_notify_failing_unstable_namespaces_no_match(action_controller):
     action_controller.get_namespaces_by = MagicMock(return_value=[])
     action_controller.notify_failing_unstable_namespaces()
     action_controller.get_namespaces_by.assert_called_once_with(
-        annotations={
-            NamespaceAnnotations.MANAGED.value: "true",
-            NamespaceAnnotations.STATUS.value: "(failing|unstable)",
-            NamespaceAnnotations.OWNER.value: ".+",
+        labels={
+            NamespaceLabels.MANAGED.value: "true",
+            NamespaceLabels.STATUS.value: (
+                NamespaceStatus.FAILING.value,
+                NamespaceStatus.UNSTABLE.value,
+            ),
         },
+        annotations={NamespaceAnnotations.OWNER.value: ".+"},
         exclude_annotations={NamespaceAnnotations.NOTIFIED_TS.value: ".+"},
     )
 
 
+def test_notify_failing_unstable_namespaces_no_slack(action_controller):
+    action_controller.slack_client = None
+    action_controller.get_namespaces_by = MagicMock(return_value=[])
+    action_controller.notify_failing_unstable_namespaces()
+    action_controller.get_namespaces_by.assert_not_called()
+
+
 def test_notify_failing_unstable_namespaces_match(action_controller):
     mock_namespace = MagicMock()
     mock_namespace.metadata.name = "test-namespace"
@@ -403,23 +477,77 @@ def test_notify_failing_unstable_namespaces_match(action_controller):
         )
     )
     phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
     phase_config.delete = False
     phase_config.notify_on_delete = False
     phase_config.notify_on_status = True
-    action_controller.notify_user = MagicMock(return_value=True)
+    action_controller.queue_notification = MagicMock(return_value=True)
     action_controller.patch_namespace = MagicMock()
 
     with patch(
-        "ska_ser_namespace_manager.controller.action_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
-        return_value=True,
-    ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.getattr",
-        return_value=phase_config,
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
     ):
         action_controller.notify_failing_unstable_namespaces()
 
-    action_controller.notify_user.assert_called_once()
+    action_controller.queue_notification.assert_called_once()
+    notify_kwargs = action_controller.queue_notification.call_args.kwargs
+    assert notify_kwargs["template"] == "failing-namespace-notification.j2"
+    assert notify_kwargs["status"] == NamespaceStatus.FAILING.value
+    assert notify_kwargs["key"] == (
+        "test-namespace",
+        NamespaceStatus.FAILING.value,
+    )
+    action_controller.patch_namespace.assert_not_called()
+
+    notify_kwargs["callback"]()
     action_controller.patch_namespace.assert_called_once()
+    patched_annotations = action_controller.patch_namespace.call_args.kwargs[
+        "annotations"
+    ]
+    assert (
+        patched_annotations[NamespaceAnnotations.NOTIFIED_STATUS.value]
+        == NamespaceStatus.FAILING.value
+    )
+    assert set(patched_annotations) == {
+        NamespaceAnnotations.NOTIFIED_TS.value,
+        NamespaceAnnotations.NOTIFIED_STATUS.value,
+    }
+
+
+def test_on_namespace_event_releases_notifications(action_controller):
+    mock_namespace = MagicMock()
+    mock_namespace.metadata.name = "test-namespace"
+    mock_namespace.metadata.annotations = {}
+    key = ("test-namespace", NamespaceStatus.FAILING.value)
+    action_controller.pending_notifications = {key}
+    action_controller.pending_notifications_lock = threading.Lock()
+    wakeup = threading.Event()
+    action_controller.task_wakeups["delete_terminal_namespaces"] = wakeup
+
+    action_controller.on_namespace_event("MODIFIED", mock_namespace)
+    assert action_controller.pending_notifications == {key}
+    assert wakeup.is_set()
+
+    mock_namespace.metadata.annotations = {
+        NamespaceAnnotations.NOTIFIED_TS.value: "2024-01-01T00:00:00Z"
+    }
+    action_controller.on_namespace_event("MODIFIED", mock_namespace)
+    assert not action_controller.pending_notifications
+
+    mock_namespace.metadata.annotations = {}
+    action_controller.pending_notifications.add(key)
+    wakeup.clear()
+    action_controller.on_namespace_event("DELETED", mock_namespace)
+    assert not action_controller.pending_notifications
+    assert not wakeup.is_set()
+
+
+def test_send_notifications(action_controller):
+    action_controller.process_notifications = MagicMock(return_value=2)
+    action_controller.send_notifications()
+    action_controller.process_notifications.assert_called_once()
 
 
 def test_notify_failing_unstable_namespaces_match_no_notify(action_controller):
@@ -443,21 +571,20 @@ def test_notify_failing_unstable_namespaces_match_no_notify(action_controller):
         )
     )
     phase_config = MagicMock()
+    ns_config = MagicMock()
+    ns_config.get_phase_config.return_value = phase_config
     phase_config.delete = False
     phase_config.notify_on_delete = False
     phase_config.notify_on_status = False
 
-    action_controller.notify_user = MagicMock(return_value=True)
+    action_controller.queue_notification = MagicMock(return_value=True)
     action_controller.patch_namespace = MagicMock()
 
     with patch(
-        "ska_ser_namespace_manager.controller.action_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
-        return_value=True,
-    ), patch(
-        "ska_ser_namespace_manager.controller.action_controller.getattr",
-        return_value=phase_config,
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=ns_config,
     ):
         action_controller.notify_failing_unstable_namespaces()
 
-    action_controller.notify_user.assert_not_called()
+    action_controller.queue_notification.assert_not_called()
     action_controller.patch_namespace.assert_not_called()
@@ -1,5 +1,8 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -13,8 +16,24 @@ from ska_ser_namespace_manager.controller.collect_controller_config import (
 from ska_ser_namespace_manager.controller.leader_controller import (
     LeaderController,
 )
+from ska_ser_namespace_manager.core.kubernetes_api import (
+    APPLY_PATCH_CONTENT_TYPE,
+    FIELD_MANAGER,
+)
 from ska_ser_namespace_manager.core.namespace import Namespace
-from ska_ser_namespace_manager.core.types import NamespaceAnnotations
+from ska_ser_namespace_manager.core.types import (
+    NamespaceAnnotations,
+    NamespaceLabels,
+)
+from ska_ser_namespace_manager.core.utils import spec_hash
+
+MANIFEST = "metadata:\n  name: test\n"
+EXPECTED_MANIFEST = {
+    "metadata": {
+        "name": "test",
+        "annotations": {NamespaceAnnotations.SPEC_HASH: ANY},
+    }
+}
 
 
 @pytest.fixture
@@ -81,6 +100,21 @@ def collect_controller(
         collect_controller_instance.namespace_jobs = [
             CollectActions.GET_OWNER_INFO
         ]
+        collect_controller_instance.manifests = {}
+        collect_controller_instance.labeled_actions = set()
+        collect_controller_instance.namespace_match_cache = {}
+        collect_controller_instance.new_namespaces = queue.Queue()
+        collect_controller_instance.dirty_namespaces = set()
+        collect_controller_instance.dirty_namespaces_lock = threading.Lock()
+        namespace_informer = MagicMock()
+        namespace_informer.synced.is_set.return_value = False
+        collect_controller_instance.namespace_informer = namespace_informer
+        collect_controller_instance.cronjob_informer = MagicMock()
+        collect_controller_instance.job_informer = MagicMock()
+        collect_controller_instance.last_synchronized = {}
+        collect_controller_instance.executor = ThreadPoolExecutor(
+            max_workers=2
+        )
         yield collect_controller_instance
 
 
@@ -141,9 +175,9 @@ def test_check_new_namespaces(collect_controller):
     mock_namespace.metadata.name = "test-namespace"
     mock_namespace.metadata.annotations = {}
 
-    collect_controller.get_namespaces_by = MagicMock(
-        return_value=[mock_namespace]
-    )
+    collect_controller.namespace_informer.get.return_value = mock_namespace
+    collect_controller.on_namespace_event("ADDED", mock_namespace)
+    collect_controller.on_namespace_event("MODIFIED", mock_namespace)
     collect_controller.to_dto = MagicMock(
         return_value=Namespace(
             name="test-namespace",
@@ -153,10 +187,10 @@ def test_check_new_namespaces(collect_controller):
     )
     collect_controller.create_collect_cronjob = MagicMock()
     collect_controller.create_collect_job = MagicMock()
-    collect_controller.patch_namespace = MagicMock()
+    collect_controller.apply_namespace = MagicMock()
 
     with patch(
-        "ska_ser_namespace_manager.controller.collect_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
         return_value=True,
     ):
         collect_controller.check_new_namespaces()
@@ -167,8 +201,12 @@ def test_check_new_namespaces(collect_controller):
     collect_controller.create_collect_job.assert_called_once_with(
         CollectActions.GET_OWNER_INFO, "test-namespace", True
     )
-    collect_controller.patch_namespace.assert_called_once_with(
+    collect_controller.apply_namespace.assert_called_once_with(
         "test-namespace",
+        labels={
+            NamespaceLabels.STATUS: "unknown",
+            NamespaceLabels.MANAGED: "true",
+        },
         annotations={
             NamespaceAnnotations.STATUS: "unknown",
             NamespaceAnnotations.MANAGED: "true",
@@ -177,12 +215,109 @@ def test_check_new_namespaces(collect_controller):
     )
 
 
+def test_check_new_namespaces_skips_managed(collect_controller):
+    mock_namespace = MagicMock()
+    mock_namespace.metadata.name = "test-namespace"
+    mock_namespace.metadata.annotations = {
+        NamespaceAnnotations.MANAGED.value: "true"
+    }
+    collect_controller.onboard_namespace = MagicMock()
+
+    collect_controller.on_namespace_event("ADDED", mock_namespace)
+    assert collect_controller.new_namespaces.empty()
+
+    collect_controller.new_namespaces.put("test-namespace")
+    collect_controller.new_namespaces.put("missing-namespace")
+    collect_controller.namespace_informer.get.side_effect = [
+        mock_namespace,
+        None,
+    ]
+    collect_controller.check_new_namespaces()
+
+    collect_controller.onboard_namespace.assert_not_called()
+    assert collect_controller.new_namespaces.empty()
+
+
+def test_on_namespace_event_evicts_deleted(collect_controller):
+    mock_namespace = MagicMock()
+    mock_namespace.metadata.name = "test-namespace"
+    mock_namespace.metadata.annotations = {}
+    collect_controller.namespace_match_cache[mock_namespace.metadata.uid] = (
+        None,
+        None,
+    )
+
+    collect_controller.on_namespace_event("DELETED", mock_namespace)
+
+    assert not collect_controller.namespace_match_cache
+    assert collect_controller.new_namespaces.empty()
+    assert collect_controller.dirty_namespaces == {"test-namespace"}
+
+
+def test_check_new_namespaces_requeues_on_failure(collect_controller):
+    mock_namespace = MagicMock()
+    mock_namespace.metadata.name = "test-namespace"
+    mock_namespace.metadata.annotations = {}
+    collect_controller.namespace_informer.get.return_value = mock_namespace
+    collect_controller.onboard_namespace = MagicMock(
+        side_effect=Exception("boom")
+    )
+
+    collect_controller.on_namespace_event("ADDED", mock_namespace)
+    collect_controller.check_new_namespaces()
+
+    assert collect_controller.new_namespaces.get_nowait() == "test-namespace"
+    assert collect_controller.new_namespaces.empty()
+
+
+def test_check_new_namespaces_requeues_on_apply_failure(collect_controller):
+    mock_namespace = MagicMock()
+    mock_namespace.metadata.name = "test-namespace"
+    mock_namespace.metadata.annotations = {}
+    collect_controller.namespace_informer.get.return_value = mock_namespace
+    collect_controller.match_namespace_config = MagicMock(return_value=True)
+    collect_controller.create_collect_cronjob = MagicMock()
+    collect_controller.create_collect_job = MagicMock()
+    collect_controller.v1 = MagicMock()
+    collect_controller.v1.patch_namespace.side_effect = Exception("boom")
+
+    collect_controller.on_namespace_event("ADDED", mock_namespace)
+    collect_controller.check_new_namespaces()
+
+    collect_controller.v1.patch_namespace.assert_called_once()
+    assert collect_controller.new_namespaces.get_nowait() == "test-namespace"
+    assert collect_controller.new_namespaces.empty()
+
+
+def test_check_new_namespaces_concurrently(collect_controller):
+    namespaces = {}
+    for name in ["ns1", "ns2", "ns3"]:
+        namespaces[name] = MagicMock()
+        namespaces[name].metadata.name = name
+        namespaces[name].metadata.annotations = {}
+        collect_controller.on_namespace_event("ADDED", namespaces[name])
+
+    def onboard_namespace(namespace):
+        if namespace.metadata.name == "ns2":
+            raise Exception("boom")
+
+    collect_controller.namespace_informer.get.side_effect = namespaces.get
+    collect_controller.onboard_namespace = MagicMock(
+        side_effect=onboard_namespace
+    )
+    collect_controller.check_new_namespaces()
+
+    assert collect_controller.onboard_namespace.call_count == 3
+    assert collect_controller.new_namespaces.get_nowait() == "ns2"
+    assert collect_controller.new_namespaces.empty()
+
+
 def test_create_collect_cronjob(collect_controller):
     collect_controller.template_factory = MagicMock()
     collect_controller.template_factory.render = MagicMock(
-        return_value="manifest"
+        return_value=MANIFEST
     )
-    collect_controller.get_cronjobs_by = MagicMock(return_value=[])
+    collect_controller.get_cronjobs_by = MagicMock()
     collect_controller.batch_v1 = MagicMock()
 
     collect_controller.create_collect_cronjob(
@@ -190,34 +325,54 @@ def test_create_collect_cronjob(collect_controller):
     )
 
     collect_controller.template_factory.render.assert_called_once()
-    collect_controller.batch_v1.create_namespaced_cron_job.assert_called_once_with(  # pylint: disable=line-too-long # noqa: E501
+    collect_controller.get_cronjobs_by.assert_not_called()
+    collect_controller.batch_v1.create_namespaced_cron_job.assert_not_called()
+    collect_controller.batch_v1.patch_namespaced_cron_job.assert_called_once_with(  # pylint: disable=line-too-long # noqa: E501
+        "test",
         collect_controller.config.context.namespace,
-        "manifest",
+        EXPECTED_MANIFEST,
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type=APPLY_PATCH_CONTENT_TYPE,
         _request_timeout=10,
     )
 
 
-def test_create_collect_cronjob_existing(collect_controller):
-    mock_cronjob = MagicMock()
-    mock_cronjob.metadata.name = "test"
+def test_render_manifest_cached(collect_controller):
     collect_controller.template_factory = MagicMock()
     collect_controller.template_factory.render = MagicMock(
-        return_value="manifest"
+        return_value=MANIFEST
     )
-    collect_controller.get_cronjobs_by = MagicMock(return_value=[mock_cronjob])
-    collect_controller.batch_v1 = MagicMock()
+    config = MagicMock()
 
-    collect_controller.create_collect_cronjob(
-        CollectActions.CHECK_NAMESPACE, "test-namespace", MagicMock()
+    first = collect_controller.render_manifest(
+        "cronjob", CollectActions.CHECK_NAMESPACE, "test-namespace", config
+    )
+    first["metadata"]["name"] = "changed"
+    second = collect_controller.render_manifest(
+        "cronjob", CollectActions.CHECK_NAMESPACE, "test-namespace", config
     )
 
     collect_controller.template_factory.render.assert_called_once()
-    collect_controller.batch_v1.patch_namespaced_cron_job.assert_called_once_with(  # pylint: disable=line-too-long # noqa: E501
-        "test",
-        collect_controller.config.context.namespace,
-        "manifest",
-        _request_timeout=10,
+    assert second == EXPECTED_MANIFEST
+    assert second["metadata"]["annotations"][
+        NamespaceAnnotations.SPEC_HASH
+    ] == spec_hash(MANIFEST)
+
+    collect_controller.render_manifest(
+        "job", CollectActions.CHECK_NAMESPACE, "test-namespace", config
     )
+    assert collect_controller.template_factory.render.call_count == 2
+    assert collect_controller.template_factory.render.call_args.args == (
+        "check-namespace-job.j2",
+    )
+
+    collect_controller.evict_manifests("test-namespace")
+    assert collect_controller.manifests == {}
+
+    # Cronjob and job syncs can both evict the same namespace
+    collect_controller.evict_manifests("test-namespace")
+    assert collect_controller.manifests == {}
 
 
 def test_synchronize_cronjobs(collect_controller):
@@ -243,6 +398,145 @@ def test_synchronize_cronjobs_no_namespace(collect_controller):
     collect_controller.get_namespace.assert_not_called()
 
 
+def test_synchronize_cronjobs_selects_by_label(collect_controller):
+    mock_cronjob = MagicMock()
+    mock_cronjob.metadata.annotations = {
+        NamespaceAnnotations.NAMESPACE: "missing-namespace"
+    }
+    collect_controller.get_cronjobs_by = MagicMock(return_value=[mock_cronjob])
+    collect_controller.get_namespace = MagicMock(return_value=None)
+    collect_controller.batch_v1 = MagicMock()
+
+    collect_controller.synchronize_cronjobs()
+    collect_controller.synchronize_cronjobs()
+
+    first, second = collect_controller.get_cronjobs_by.call_args_list
+    assert first.kwargs["annotations"] == {
+        NamespaceAnnotations.ACTION: CollectActions.CHECK_NAMESPACE
+    }
+    assert second.kwargs["labels"] == {
+        NamespaceLabels.ACTION.value: ["check-namespace"]
+    }
+    assert (
+        collect_controller.batch_v1.delete_namespaced_cron_job.call_count == 1
+    )
+
+
+def test_synchronize_skipped_when_namespaces_unchanged(collect_controller):
+    collect_controller.namespace_informer.synced.is_set.return_value = True
+    collect_controller.namespace_informer.generation = 1
+    collect_controller.cronjob_informer.generation = 0
+    collect_controller.job_informer.generation = 0
+    collect_controller.get_cronjobs_by = MagicMock(return_value=[])
+    collect_controller.get_jobs_by = MagicMock(return_value=[])
+
+    collect_controller.synchronize_cronjobs()
+    collect_controller.synchronize_jobs()
+    collect_controller.synchronize_cronjobs()
+    collect_controller.synchronize_jobs()
+    assert collect_controller.get_cronjobs_by.call_count == 1
+    assert collect_controller.get_jobs_by.call_count == 1
+
+    collect_controller.namespace_informer.generation = 2
+    collect_controller.synchronize_cronjobs()
+    assert collect_controller.get_cronjobs_by.call_count == 2
+
+    collect_controller.last_synchronized["synchronize_jobs"] = (2, 0.0)
+    collect_controller.synchronize_jobs()
+    assert collect_controller.get_jobs_by.call_count == 2
+
+    collect_controller.cronjob_informer.generation = 1
+    collect_controller.synchronize_cronjobs()
+    assert collect_controller.get_cronjobs_by.call_count == 3
+
+    collect_controller.job_informer.synced.is_set.return_value = False
+    collect_controller.synchronize_jobs()
+    collect_controller.synchronize_jobs()
+    assert collect_controller.get_jobs_by.call_count == 4
+
+
+def test_synchronize_cronjobs_failure(collect_controller):
+    mock_cronjob1 = MagicMock()
+    mock_cronjob1.metadata.annotations = {
+        NamespaceAnnotations.NAMESPACE: "ns1"
+    }
+    mock_cronjob2 = MagicMock()
+    mock_cronjob2.metadata.annotations = {
+        NamespaceAnnotations.NAMESPACE: "ns2"
+    }
+    collect_controller.get_cronjobs_by = MagicMock(
+        return_value=[mock_cronjob1, mock_cronjob2]
+    )
+    collect_controller.get_namespace = MagicMock(return_value=None)
+    collect_controller.batch_v1 = MagicMock()
+    collect_controller.batch_v1.delete_namespaced_cron_job.side_effect = [
+        Exception("Failed to delete cronjob"),
+        None,
+    ]
+
+    collect_controller.synchronize_cronjobs()
+
+    assert (
+        collect_controller.batch_v1.delete_namespaced_cron_job.call_count == 2
+    )
+    assert "synchronize_cronjobs" not in collect_controller.last_synchronized
+    assert not collect_controller.labeled_actions
+
+    collect_controller.batch_v1.delete_namespaced_cron_job.side_effect = None
+    collect_controller.synchronize_cronjobs()
+
+    assert "synchronize_cronjobs" in collect_controller.last_synchronized
+    assert collect_controller.labeled_actions == {
+        ("cronjob", CollectActions.CHECK_NAMESPACE)
+    }
+
+
+def test_get_resources_by_action(collect_controller):
+    actions = [CollectActions.CHECK_NAMESPACE, CollectActions.GET_OWNER_INFO]
+    mock_cronjob1 = MagicMock()
+    mock_cronjob1.metadata.labels = {
+        NamespaceLabels.ACTION.value: "check-namespace"
+    }
+    mock_cronjob2 = MagicMock()
+    mock_cronjob2.metadata.labels = {
+        NamespaceLabels.ACTION.value: "get-owner-info"
+    }
+    mock_cronjob3 = MagicMock()
+    list_func = MagicMock(return_value=[mock_cronjob1, mock_cronjob2])
+    collect_controller.labeled_actions = {
+        ("cronjob", CollectActions.CHECK_NAMESPACE),
+        ("cronjob", CollectActions.GET_OWNER_INFO),
+    }
+
+    assert collect_controller.get_resources_by_action(
+        "cronjob", actions, list_func, "default-namespace"
+    ) == {
+        CollectActions.CHECK_NAMESPACE: [mock_cronjob1],
+        CollectActions.GET_OWNER_INFO: [mock_cronjob2],
+    }
+    list_func.assert_called_once_with(
+        namespace="default-namespace",
+        labels={
+            NamespaceLabels.ACTION.value: ["check-namespace", "get-owner-info"]
+        },
+    )
+
+    list_func.reset_mock()
+    list_func.side_effect = [[mock_cronjob1], [mock_cronjob3]]
+    collect_controller.labeled_actions = {
+        ("cronjob", CollectActions.CHECK_NAMESPACE)
+    }
+    assert collect_controller.get_resources_by_action(
+        "cronjob", actions, list_func, "default-namespace"
+    ) == {
+        CollectActions.CHECK_NAMESPACE: [mock_cronjob1],
+        CollectActions.GET_OWNER_INFO: [mock_cronjob3],
+    }
+    assert list_func.call_args.kwargs["annotations"] == {
+        NamespaceAnnotations.ACTION: CollectActions.GET_OWNER_INFO
+    }
+
+
 def test_synchronize_jobs(collect_controller):
     collect_controller.get_jobs_by = MagicMock(return_value=[])
     collect_controller.batch_v1 = MagicMock()
@@ -260,31 +554,27 @@ def test_synchronize_jobs_delete_jobs(collect_controller):
     collect_controller.get_jobs_by = MagicMock(return_value=[mock_job])
     collect_controller.get_namespace = MagicMock(return_value=None)
     collect_controller.batch_v1 = MagicMock()
-    mock_pod = MagicMock()
-    mock_pod.metadata.name = "test"
-    collect_controller.get_namespace_pods_by = MagicMock(
-        return_value=[mock_pod, mock_pod]
-    )
     collect_controller.v1 = MagicMock()
 
     collect_controller.synchronize_jobs()
 
     collect_controller.get_jobs_by.assert_called_once()
     collect_controller.batch_v1.delete_namespaced_job.assert_called_once_with(
-        "test-job", "default-namespace", _request_timeout=10
-    )
-    collect_controller.v1.delete_namespaced_pod.assert_any_call(
-        "test", "default-namespace", _request_timeout=10
+        "test-job",
+        "default-namespace",
+        propagation_policy="Background",
+        _request_timeout=10,
     )
+    collect_controller.v1.delete_namespaced_pod.assert_not_called()
     collect_controller.batch_v1.patch_namespaced_job.assert_not_called()
 
 
 def test_create_collect_job(collect_controller):
     collect_controller.template_factory = MagicMock()
     collect_controller.template_factory.render = MagicMock(
-        return_value="manifest"
+        return_value=MANIFEST
     )
-    collect_controller.get_jobs_by = MagicMock(return_value=[])
+    collect_controller.get_jobs_by = MagicMock()
     collect_controller.batch_v1 = MagicMock()
 
     collect_controller.create_collect_job(
@@ -292,32 +582,15 @@ def test_create_collect_job(collect_controller):
     )
 
     collect_controller.template_factory.render.assert_called_once()
-    collect_controller.batch_v1.create_namespaced_job.assert_called_once_with(
-        collect_controller.config.context.namespace,
-        "manifest",
-        _request_timeout=10,
-    )
-
-
-def test_create_collect_job_existing(collect_controller):
-    mock_cronjob = MagicMock()
-    mock_cronjob.metadata.name = "test"
-    collect_controller.template_factory = MagicMock()
-    collect_controller.template_factory.render = MagicMock(
-        return_value="manifest"
-    )
-    collect_controller.get_jobs_by = MagicMock(return_value=[mock_cronjob])
-    collect_controller.batch_v1 = MagicMock()
-
-    collect_controller.create_collect_job(
-        CollectActions.CHECK_NAMESPACE, "test-namespace", MagicMock()
-    )
-
-    collect_controller.template_factory.render.assert_called_once()
+    collect_controller.get_jobs_by.assert_not_called()
+    collect_controller.batch_v1.create_namespaced_job.assert_not_called()
     collect_controller.batch_v1.patch_namespaced_job.assert_called_once_with(
         "test",
         collect_controller.config.context.namespace,
-        "manifest",
+        EXPECTED_MANIFEST,
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type=APPLY_PATCH_CONTENT_TYPE,
         _request_timeout=10,
     )
 
@@ -357,6 +630,7 @@ def test_delete_job_for_missing_namespace(collect_controller):
     collect_controller.batch_v1.delete_namespaced_job.assert_called_once_with(
         mock_job.metadata.name,
         collect_controller.config.context.namespace,
+        propagation_policy="Background",
         _request_timeout=10,
     )
 
@@ -379,12 +653,12 @@ def test_patch_cronjob_for_existing_namespace(collect_controller):
     )
     collect_controller.template_factory = MagicMock()
     collect_controller.template_factory.render = MagicMock(
-        return_value="manifest"
+        return_value=MANIFEST
     )
     collect_controller.batch_v1 = MagicMock()
 
     with patch(
-        "ska_ser_namespace_manager.controller.collect_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
         return_value=MagicMock(),
     ):
         collect_controller.synchronize_cronjobs()
@@ -392,11 +666,41 @@ def test_patch_cronjob_for_existing_namespace(collect_controller):
     collect_controller.batch_v1.patch_namespaced_cron_job.assert_called_once_with(  # pylint: disable=line-too-long # noqa: E501
         mock_cronjob.metadata.name,
         collect_controller.config.context.namespace,
-        "manifest",
+        EXPECTED_MANIFEST,
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type=APPLY_PATCH_CONTENT_TYPE,
         _request_timeout=10,
     )
 
 
+def test_synchronize_cronjobs_caches_match(collect_controller):
+    mock_cronjob = MagicMock()
+    mock_cronjob.metadata.annotations = {
+        NamespaceAnnotations.NAMESPACE: "test-namespace"
+    }
+    mock_cronjob.metadata.labels = {
+        NamespaceLabels.ACTION.value: "check-namespace"
+    }
+    collect_controller.get_cronjobs_by = MagicMock(return_value=[mock_cronjob])
+    collect_controller.get_namespace = MagicMock(return_value=MagicMock())
+    collect_controller.to_dto = MagicMock()
+    collect_controller.render_manifest = MagicMock()
+    collect_controller.batch_v1 = MagicMock()
+
+    with patch(
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value=MagicMock(),
+    ) as mock_match_namespace:
+        collect_controller.synchronize_cronjobs()
+        collect_controller.synchronize_cronjobs()
+
+    mock_match_namespace.assert_called_once()
+    assert (
+        collect_controller.batch_v1.patch_namespaced_cron_job.call_count == 2
+    )
+
+
 def test_patch_job_for_existing_namespace(collect_controller):
     mock_job = MagicMock()
     mock_job.metadata.annotations = {
@@ -415,12 +719,12 @@ def test_patch_job_for_existing_namespace(collect_controller):
     )
     collect_controller.template_factory = MagicMock()
     collect_controller.template_factory.render = MagicMock(
-        return_value="manifest"
+        return_value=MANIFEST
     )
     collect_controller.batch_v1 = MagicMock()
 
     with patch(
-        "ska_ser_namespace_manager.controller.collect_controller.match_namespace",  # pylint: disable=line-too-long # noqa: E501
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
         return_value=MagicMock(),
     ):
         collect_controller.synchronize_jobs()
@@ -428,7 +732,10 @@ def test_patch_job_for_existing_namespace(collect_controller):
     collect_controller.batch_v1.patch_namespaced_job.assert_called_once_with(
         mock_job.metadata.name,
         collect_controller.config.context.namespace,
-        "manifest",
+        EXPECTED_MANIFEST,
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type=APPLY_PATCH_CONTENT_TYPE,
         _request_timeout=10,
     )
 
@@ -437,14 +744,17 @@ def test_generate_metrics(collect_controller):
     mock_namespace = MagicMock()
     mock_namespace.metadata.name = "test-namespace"
     mock_namespace.metadata.annotations = {}
+    mock_forbidden_namespace = MagicMock()
+    mock_forbidden_namespace.metadata.name = "kube-system"
 
+    collect_controller.forbidden_namespaces = frozenset(["kube-system"])
     collect_controller.get_namespaces_by = MagicMock(
-        return_value=[mock_namespace]
+        return_value=[mock_forbidden_namespace, mock_namespace]
     )
 
     collect_controller.metrics_manager = MagicMock()
     collect_controller.metrics_manager.delete_stale_metrics = MagicMock()
-    collect_controller.metrics_manager.update_namespace_metrics = MagicMock()
+    collect_controller.metrics_manager.update_namespaces_metrics = MagicMock()
     collect_controller.metrics_manager.save_metrics = MagicMock()
 
     collect_controller.generate_metrics()
@@ -452,4 +762,80 @@ def test_generate_metrics(collect_controller):
     collect_controller.metrics_manager.delete_stale_metrics.assert_called_once_with(  # pylint: disable=line-too-long  # noqa: E501
         [mock_namespace.metadata.name]
     )
+    collect_controller.metrics_manager.update_namespaces_metrics.assert_called_once_with(  # pylint: disable=line-too-long  # noqa: E501
+        [mock_namespace]
+    )
+    collect_controller.metrics_manager.save_metrics.assert_not_called()
+    assert "generate_metrics" not in collect_controller.last_synchronized
+
+
+def test_generate_metrics_incrementally(collect_controller):
+    namespaces = {}
+    for name, annotations in [
+        ("managed", {NamespaceAnnotations.MANAGED.value: "true"}),
+        ("unmanaged", {}),
+        ("kube-system", {NamespaceAnnotations.MANAGED.value: "true"}),
+    ]:
+        namespaces[name] = MagicMock()
+        namespaces[name].metadata.name = name
+        namespaces[name].metadata.annotations = annotations
+
+    collect_controller.forbidden_namespaces = frozenset(["kube-system"])
+    collect_controller.namespace_informer.synced.is_set.return_value = True
+    collect_controller.namespace_informer.generation = 1
+    collect_controller.namespace_informer.get.side_effect = namespaces.get
+    collect_controller.get_namespaces_by = MagicMock(
+        return_value=[namespaces["managed"]]
+    )
+    collect_controller.metrics_manager = MagicMock()
+
+    collect_controller.on_namespace_event("ADDED", namespaces["managed"])
+    collect_controller.generate_metrics()
+
+    # The first run after the informer synced is a full pass
+    collect_controller.get_namespaces_by.assert_called_once()
+    collect_controller.metrics_manager.delete_stale_metrics.assert_called_once_with(  # pylint: disable=line-too-long  # noqa: E501
+        ["managed"]
+    )
+    assert not collect_controller.dirty_namespaces
+
+    collect_controller.generate_metrics()
+    collect_controller.metrics_manager.update_namespaces_metrics.assert_called_with(  # pylint: disable=line-too-long  # noqa: E501
+        []
+    )
+
+    for namespace in namespaces.values():
+        collect_controller.on_namespace_event("MODIFIED", namespace)
+    deleted_namespace = MagicMock()
+    deleted_namespace.metadata.name = "deleted"
+    collect_controller.namespace_match_cache[
+        deleted_namespace.metadata.uid
+    ] = (
+        None,
+        None,
+    )
+    collect_controller.on_namespace_event("DELETED", deleted_namespace)
+    assert not collect_controller.namespace_match_cache
+    collect_controller.generate_metrics()
+
+    collect_controller.get_namespaces_by.assert_called_once()
+    assert sorted(
+        collect_controller.metrics_manager.delete_namespaces_metrics.call_args.args[  # pylint: disable=line-too-long  # noqa: E501
+            0
+        ]
+    ) == ["deleted", "kube-system", "unmanaged"]
+    collect_controller.metrics_manager.update_namespaces_metrics.assert_called_with(  # pylint: disable=line-too-long  # noqa: E501
+        [namespaces["managed"]]
+    )
+
+
+def test_save_metrics(collect_controller):
+    collect_controller.metrics_manager = MagicMock()
+    collect_controller.metrics_manager.dirty = False
+
+    collect_controller.save_metrics()
+    collect_controller.metrics_manager.save_metrics.assert_not_called()
+
+    collect_controller.metrics_manager.dirty = True
+    collect_controller.save_metrics()
     collect_controller.metrics_manager.save_metrics.assert_called_once()
@@ -1,4 +1,5 @@
 import datetime
+import signal
 import threading
 import time
 from unittest.mock import MagicMock, patch
@@ -9,6 +10,7 @@ from ska_ser_namespace_manager.controller.controller import (
     Controller,
     conditional_controller_task,
     controller_task,
+    next_deadline,
 )
 
 
@@ -58,11 +60,60 @@ def test_add_tasks(controller):
     assert controller.threads["dummy_task"]._target == dummy_task
 
 
+def test_match_namespace_config(controller):
+    namespace = MagicMock()
+    namespace.metadata.uid = "uid"
+    namespace.metadata.resource_version = "1"
+    controller.to_dto = MagicMock()
+
+    with patch(
+        "ska_ser_namespace_manager.controller.controller.match_namespace",
+        return_value="config",
+    ) as mock_match_namespace:
+        assert controller.match_namespace_config(namespace) == "config"
+        assert controller.match_namespace_config(namespace) == "config"
+        mock_match_namespace.assert_called_once()
+
+        namespace.metadata.resource_version = "2"
+        assert controller.match_namespace_config(namespace) == "config"
+        assert mock_match_namespace.call_count == 2
+
+        controller.config.namespaces = MagicMock()
+        assert controller.match_namespace_config(namespace) == "config"
+        assert mock_match_namespace.call_count == 3
+        assert len(controller.namespace_match_cache) == 1
+
+        controller.evict_namespace_match(namespace)
+        assert not controller.namespace_match_cache
+        assert controller.match_namespace_config(namespace) == "config"
+        assert mock_match_namespace.call_count == 4
+
+
+def test_forbidden_namespaces(controller):
+    assert isinstance(controller.forbidden_namespaces, frozenset)
+    assert "kube-system" in controller.forbidden_namespaces
+    assert "default-namespace" in controller.forbidden_namespaces
+
+
 def test_terminate(controller):
     controller.terminate()
     assert controller.shutdown_event.is_set()
 
 
+def test_shutdown_signal(controller):
+    controller._ThreadManager__shutdown(signal.SIGTERM, None)
+    assert controller.shutdown_event.is_set()
+    assert controller.shutdown_signal == signal.SIGTERM
+
+    with patch(
+        "ska_ser_namespace_manager.core.thread_manager.logging.info"
+    ) as mock_logging_info:
+        controller.cleanup()
+        mock_logging_info.assert_called_once_with(
+            "Stopped after receiving shutdown signal: %s", "SIGTERM"
+        )
+
+
 @patch("ska_ser_namespace_manager.controller.controller.logging.debug")
 def test_run_controller(mock_logging_debug, controller):
     def dummy_task():
@@ -79,6 +130,31 @@ def test_run_controller(mock_logging_debug, controller):
         controller.cleanup.assert_called_once()
 
 
+def test_next_deadline():
+    with patch(
+        "ska_ser_namespace_manager.controller.controller.time.monotonic",
+        return_value=100.0,
+    ), patch(
+        "ska_ser_namespace_manager.controller.controller.logging.warning"
+    ) as mock_logging_warning:
+        assert next_deadline("task", 95.0, 10.0) == 105.0
+        mock_logging_warning.assert_not_called()
+
+        # Overrunning tasks skip the missed ticks
+        assert next_deadline("task", 75.0, 10.0) == 105.0
+        mock_logging_warning.assert_called_once_with(
+            "Task '%s' overran its %.3fs period, skipping %s ticks",
+            "task",
+            10.0,
+            2,
+        )
+
+        # Tasks without a period have no ticks to miss
+        mock_logging_warning.reset_mock()
+        assert next_deadline("task", 75.0, 0.0) == 100.0
+        mock_logging_warning.assert_not_called()
+
+
 def test_controller_task_decorator(controller):
     class TestController(Controller):
         def __init__(self, *args, **kwargs):
@@ -129,6 +205,81 @@ def test_controller_task_decorator(controller):
         assert mock_logging_error.call_count > 0
 
 
+def test_controller_task_decorator_backoff(controller):
+    class TestController(Controller):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.idle_call_count = 0
+            self.busy_call_count = 0
+
+        @controller_task(
+            period=datetime.timedelta(milliseconds=10),
+            max_period=datetime.timedelta(milliseconds=80),
+        )
+        def idle_task(self):
+            self.idle_call_count += 1
+            return 0
+
+        @controller_task(
+            period=datetime.timedelta(milliseconds=10),
+            max_period=datetime.timedelta(milliseconds=80),
+        )
+        def busy_task(self):
+            self.busy_call_count += 1
+            return 1
+
+    test_controller = TestController(config_class=MagicMock(), tasks=[])
+
+    threads = [
+        threading.Thread(target=test_controller.idle_task),
+        threading.Thread(target=test_controller.busy_task),
+    ]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(0.3)
+    test_controller.shutdown_event.set()
+    for thread in threads:
+        thread.join()
+
+    # Idle task backs off (10+20+40+80+80 ms), busy task keeps its period
+    assert test_controller.idle_call_count < 8
+    assert test_controller.busy_call_count > test_controller.idle_call_count
+
+
+def test_controller_task_decorator_wakeup(controller):
+    class TestController(Controller):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.call_times = []
+
+        @controller_task(
+            period=datetime.timedelta(milliseconds=10),
+            max_period=datetime.timedelta(seconds=10),
+        )
+        def idle_task(self):
+            self.call_times.append(time.monotonic())
+            return 0
+
+    test_controller = TestController(config_class=MagicMock(), tasks=[])
+
+    thread = threading.Thread(target=test_controller.idle_task)
+    thread.start()
+
+    # Let the task back off well past its period, then wake it up
+    time.sleep(0.3)
+    calls = len(test_controller.call_times)
+    woken_at = time.monotonic()
+    test_controller.wake_tasks()
+    time.sleep(0.1)
+    test_controller.shutdown_event.set()
+    thread.join()
+
+    assert "idle_task" in test_controller.task_wakeups
+    assert len(test_controller.call_times) > calls
+    assert test_controller.call_times[calls] - woken_at < 0.05
+
+
 def test_conditional_controller_task_decorator(controller):
     class TestController(Controller):
         def __init__(self, *args, **kwargs):
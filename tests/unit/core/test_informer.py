@@ -0,0 +1,215 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client.exceptions import ApiException
+
+from ska_ser_namespace_manager.core.informer import Informer, label_index
+
+
+def make_resource(name, resource_version="1", namespace=None, labels=None):
+    resource = MagicMock()
+    resource.metadata.name = name
+    resource.metadata.namespace = namespace
+    resource.metadata.resource_version = resource_version
+    resource.metadata.labels = labels
+    return resource
+
+
+@pytest.fixture
+def list_func():
+    func = MagicMock()
+    func.return_value.items = [make_resource("ns1"), make_resource("ns2")]
+    func.return_value.metadata.resource_version = "10"
+    return func
+
+
+@pytest.fixture
+def informer(list_func):
+    return Informer(
+        "test_informer", list_func, threading.Event(), label_selector="a=b"
+    )
+
+
+def test_informer_key():
+    assert Informer.key(make_resource("ns1")) == "ns1"
+    assert Informer.key(make_resource("job", namespace="ns1")) == "ns1/job"
+
+
+def test_informer_relist(informer, list_func):
+    assert not informer.synced.is_set()
+    informer.relist()
+
+    list_func.assert_called_once_with(
+        label_selector="a=b", resource_version="0", _request_timeout=10
+    )
+    assert informer.synced.is_set()
+    assert informer.resource_version == "10"
+    assert [ns.metadata.name for ns in informer.list()] == ["ns1", "ns2"]
+    assert informer.get("ns1").metadata.name == "ns1"
+    assert informer.get("ns3") is None
+
+
+def test_informer_watch(informer):
+    informer.relist()
+    events = [
+        {"type": "ADDED", "object": make_resource("ns3", "11")},
+        {"type": "MODIFIED", "object": make_resource("ns1", "12")},
+        {"type": "DELETED", "object": make_resource("ns2", "13")},
+        {"type": "BOOKMARK", "object": make_resource("", "14")},
+    ]
+
+    with patch(
+        "ska_ser_namespace_manager.core.informer.watch.Watch"
+    ) as mock_watch_class:
+        mock_watch = mock_watch_class.return_value
+        mock_watch.stream.return_value = iter(events)
+        mock_watch.resource_version = "14"
+        informer.watch()
+
+    _, kwargs = mock_watch.stream.call_args
+    assert kwargs["resource_version"] == "10"
+    assert kwargs["allow_watch_bookmarks"] is True
+    assert kwargs["label_selector"] == "a=b"
+    assert informer.resource_version == "14"
+    assert sorted(ns.metadata.name for ns in informer.list()) == [
+        "ns1",
+        "ns3",
+    ]
+    assert informer.get("ns1").metadata.resource_version == "12"
+
+
+def test_informer_relists_on_gone(informer, list_func):
+    calls = []
+
+    def watch():
+        calls.append(informer.resource_version)
+        if len(calls) == 1:
+            raise ApiException(status=410)
+        informer.shutdown_event.set()
+
+    informer.watch = watch
+    informer()
+
+    assert list_func.call_count == 2
+    assert calls == ["10", "10"]
+    assert "resource_version" not in list_func.call_args_list[1].kwargs
+    assert not informer.expired
+
+
+def test_informer_relist_dispatches_deleted(informer, list_func):
+    informer.relist()
+    events = []
+    informer.add_handler(
+        lambda event_type, obj: events.append((event_type, obj.metadata.name))
+    )
+    generation = informer.generation
+
+    list_func.return_value.items = [make_resource("ns1", "11")]
+    informer.relist()
+
+    assert events == [("DELETED", "ns2"), ("ADDED", "ns1")]
+    assert informer.get("ns2") is None
+    assert informer.generation > generation
+
+
+def test_informer_recovers_from_failure(informer, list_func):
+    list_func.side_effect = [Exception("boom"), list_func.return_value]
+    informer.shutdown_event.wait = MagicMock()
+
+    def watch():
+        informer.shutdown_event.set()
+
+    informer.watch = watch
+    informer()
+
+    assert list_func.call_count == 2
+    informer.shutdown_event.wait.assert_called_once_with(timeout=1)
+    assert informer.synced.is_set()
+
+
+def test_informer_index(informer, list_func):
+    list_func.return_value.items = [
+        make_resource("ns1", labels={"status": "stale"}),
+        make_resource("ns2", labels={"status": "ok"}),
+        make_resource("ns3"),
+    ]
+    informer.add_index("status", label_index("status"))
+    assert informer.has_index("status")
+    assert not informer.has_index("owner")
+
+    informer.relist()
+    assert [
+        ns.metadata.name for ns in informer.by_index("status", "stale")
+    ] == ["ns1"]
+    assert informer.by_index("status", "failed") == []
+
+    events = [
+        {
+            "type": "MODIFIED",
+            "object": make_resource("ns2", "11", labels={"status": "stale"}),
+        },
+        {"type": "DELETED", "object": make_resource("ns1", "12")},
+    ]
+    with patch(
+        "ska_ser_namespace_manager.core.informer.watch.Watch"
+    ) as mock_watch_class:
+        mock_watch_class.return_value.stream.return_value = iter(events)
+        informer.watch()
+
+    assert [
+        ns.metadata.name for ns in informer.by_index("status", "stale")
+    ] == ["ns2"]
+    assert informer.by_index("status", "ok") == []
+
+
+def test_informer_handlers(informer):
+    handler = MagicMock()
+    handler.side_effect = [Exception("boom"), None, None, None]
+    informer.add_handler(handler)
+    informer.relist()
+
+    assert [
+        (call.args[0], call.args[1].metadata.name)
+        for call in handler.call_args_list
+    ] == [("ADDED", "ns1"), ("ADDED", "ns2")]
+
+    events = [
+        {"type": "MODIFIED", "object": make_resource("ns1", "11")},
+        {"type": "BOOKMARK", "object": make_resource("", "12")},
+    ]
+    with patch(
+        "ska_ser_namespace_manager.core.informer.watch.Watch"
+    ) as mock_watch_class:
+        mock_watch_class.return_value.stream.return_value = iter(events)
+        informer.watch()
+
+    assert handler.call_count == 3
+    assert handler.call_args.args[0] == "MODIFIED"
+
+
+def test_informer_generation(informer):
+    informer.relist()
+    generation = informer.generation
+    assert generation > 0
+
+    events = [
+        {"type": "BOOKMARK", "object": make_resource("", "11")},
+        {"type": "DELETED", "object": make_resource("ns3", "12")},
+    ]
+    with patch(
+        "ska_ser_namespace_manager.core.informer.watch.Watch"
+    ) as mock_watch_class:
+        mock_watch_class.return_value.stream.return_value = iter(events)
+        informer.watch()
+
+    assert informer.generation == generation
+
+    events = [{"type": "DELETED", "object": make_resource("ns1", "13")}]
+    with patch(
+        "ska_ser_namespace_manager.core.informer.watch.Watch"
+    ) as mock_watch_class:
+        mock_watch_class.return_value.stream.return_value = iter(events)
+        informer.watch()
+
+    assert informer.generation > generation
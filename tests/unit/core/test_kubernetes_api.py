@@ -1,9 +1,18 @@
+import re
+import socket
 from unittest.mock import MagicMock, patch
 
 import pytest
 from kubernetes.client.exceptions import ApiException
 
-from ska_ser_namespace_manager.core.kubernetes_api import KubernetesAPI
+from ska_ser_namespace_manager.core.kubernetes_api import (
+    APPLY_PATCH_CONTENT_TYPE,
+    FIELD_MANAGER,
+    KubernetesAPI,
+    compile_regex,
+    get_api_client,
+    is_literal_pattern,
+)
 
 
 @pytest.fixture
@@ -15,12 +24,15 @@ def mock_kubernetes_api():
     ) as MockAppsV1Api, patch(
         "ska_ser_namespace_manager.core.kubernetes_api.client.BatchV1Api"
     ) as MockBatchV1Api, patch(
+        "ska_ser_namespace_manager.core.kubernetes_api.client.ApiClient"
+    ) as MockApiClient, patch(
         "ska_ser_namespace_manager.core.kubernetes_api.config.load_kube_config",  # pylint: disable=line-too-long # noqa: E501
         new_callable=MagicMock(),
     ) as MockLoadKubeConfig, patch(
         "ska_ser_namespace_manager.core.kubernetes_api.config.load_incluster_config",  # pylint: disable=line-too-long # noqa: E501
         new_callable=MagicMock(),
     ) as MockLoadInclusterConfig:
+        get_api_client.cache_clear()
 
         # Create mocks for the API instances
         mock_core_v1_api = MockCoreV1Api.return_value
@@ -28,6 +40,10 @@ def mock_kubernetes_api():
         mock_batch_v1_api = MockBatchV1Api.return_value
 
         yield {
+            "mock_api_client": MockApiClient,
+            "mock_core_v1_api_class": MockCoreV1Api,
+            "mock_apps_v1_api_class": MockAppsV1Api,
+            "mock_batch_v1_api_class": MockBatchV1Api,
             "mock_core_v1_api": mock_core_v1_api,
             "mock_apps_v1_api": mock_apps_v1_api,
             "mock_batch_v1_api": mock_batch_v1_api,
@@ -36,6 +52,20 @@ def mock_kubernetes_api():
         }
 
 
+def test_api_client_keepalive():
+    api_client = get_api_client.__wrapped__()
+    pool = api_client.rest_client.pool_manager.connection_from_host(
+        "localhost", 6443, scheme="https"
+    )
+    socket_options = pool.conn_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    assert (
+        socket.IPPROTO_TCP,
+        socket.TCP_NODELAY,
+        1,
+    ) in socket_options
+
+
 def test_load_incluster_kubeconfig(mock_kubernetes_api):
     mocks = mock_kubernetes_api
     mock_load_kube_config = mocks["mock_load_kube_config"]
@@ -46,6 +76,28 @@ def test_load_incluster_kubeconfig(mock_kubernetes_api):
     mock_load_kube_config.assert_not_called()
 
 
+def test_shared_api_client(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_api_client = mocks["mock_api_client"]
+
+    api = KubernetesAPI()
+    mock_api_client.assert_called_once()
+    configuration = mock_api_client.call_args.args[0]
+    assert configuration.connection_pool_maxsize == 32
+    assert configuration.retries.total == 5
+    assert 503 in configuration.retries.status_forcelist
+    assert not configuration.retries.raise_on_status
+    assert api.api_client == mock_api_client.return_value
+    for api_class in ["core", "apps", "batch"]:
+        mocks[f"mock_{api_class}_v1_api_class"].assert_called_once_with(
+            mock_api_client.return_value
+        )
+
+    other_api = KubernetesAPI()
+    mock_api_client.assert_called_once()
+    assert other_api.api_client is api.api_client
+
+
 def test_load_kubeconfig_with_file(mock_kubernetes_api):
     mocks = mock_kubernetes_api
 
@@ -160,6 +212,36 @@ def test_get_namespace_failure(mock_kubernetes_api):
 # Test get_namespaces_by
 
 
+def test_compile_regex_is_cached():
+    compile_regex.cache_clear()
+    assert compile_regex("(failing|unstable)") is compile_regex(
+        "(failing|unstable)"
+    )
+    assert compile_regex.cache_info().hits == 1
+
+
+def test_literal_patterns(mock_kubernetes_api):
+    assert is_literal_pattern("true")
+    assert is_literal_pattern("ska-ser_namespace/manager")
+    assert not is_literal_pattern(".+")
+    assert not is_literal_pattern("(failing|unstable)")
+    assert not is_literal_pattern("1.0")
+
+    api = KubernetesAPI()
+    compile_regex.cache_clear()
+    for value, pattern in [
+        ("true", "true"),
+        ("true-ish", "true"),
+        ("false", "true"),
+        ("stale", "(stale|failed)"),
+        ("ok", "(stale|failed)"),
+    ]:
+        assert api._matches_regex(value, pattern) == (
+            re.match(pattern, value) is not None
+        )
+    assert compile_regex.cache_info().misses == 1
+
+
 def test_get_namespaces_by_success(mock_kubernetes_api):
     mocks = mock_kubernetes_api
 
@@ -177,7 +259,9 @@ def test_get_namespaces_by_success(mock_kubernetes_api):
     assert len(namespaces) == 1
     assert namespaces[0].metadata.name == "test"
     mock_v1.list_namespace.assert_called_once_with(
-        label_selector="env=prod", _request_timeout=10
+        label_selector="env=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -201,10 +285,121 @@ def test_get_namespaces_by_exclude_labels(mock_kubernetes_api):
     assert len(namespaces) == 1
     assert namespaces[0].metadata.name == "namespace2"
     mock_v1.list_namespace.assert_called_once_with(
-        label_selector="env!=prod", _request_timeout=10
+        label_selector="env!=prod",
+        resource_version="0",
+        _request_timeout=10,
+    )
+
+
+def test_get_namespaces_by_label_sets(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_v1 = mocks["mock_core_v1_api"]
+    mock_v1.list_namespace.return_value.items = []
+
+    api = KubernetesAPI()
+    api.get_namespaces_by(
+        labels={"managed": "true", "status": ["failed", "stale"]},
+        exclude_labels={"env": ("dev", "test")},
+    )
+
+    mock_v1.list_namespace.assert_called_once_with(
+        label_selector="managed=true,status in (failed,stale),"
+        "env notin (dev,test)",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
+def test_get_namespace_informer(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_v1 = mocks["mock_core_v1_api"]
+
+    api = KubernetesAPI()
+    api.namespace_informer = MagicMock()
+    assert api.get_namespace("test") is api.namespace_informer.get.return_value
+    api.namespace_informer.get.assert_called_once_with("test")
+    mock_v1.read_namespace.assert_not_called()
+
+    api.namespace_informer.synced.is_set.return_value = False
+    assert api.get_namespace("test") is mock_v1.read_namespace.return_value
+    mock_v1.read_namespace.assert_called_once_with(
+        name="test", _request_timeout=10
+    )
+
+
+def test_get_namespaces_by_informer(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_v1 = mocks["mock_core_v1_api"]
+
+    mock_ns1 = MagicMock()
+    mock_ns1.metadata.name = "namespace1"
+    mock_ns1.metadata.labels = {"status": "stale"}
+    mock_ns1.metadata.annotations = {"team": "dev"}
+    mock_ns2 = MagicMock()
+    mock_ns2.metadata.name = "namespace2"
+    mock_ns2.metadata.labels = {"status": "ok"}
+    mock_ns2.metadata.annotations = {"team": "dev"}
+    mock_ns3 = MagicMock()
+    mock_ns3.metadata.name = "namespace3"
+    mock_ns3.metadata.labels = {"status": "failed", "env": "dev"}
+    mock_ns3.metadata.annotations = {"team": "dev"}
+
+    api = KubernetesAPI()
+    api.namespace_informer = MagicMock()
+    api.namespace_informer.has_index.return_value = False
+    api.namespace_informer.list.return_value = [mock_ns1, mock_ns2, mock_ns3]
+    namespaces = api.get_namespaces_by(
+        labels={"status": ["failed", "stale"]},
+        annotations={"team": "dev"},
+        exclude_labels={"env": "dev"},
+    )
+
+    assert namespaces == [mock_ns1]
+    mock_v1.list_namespace.assert_not_called()
+
+    api.namespace_informer.synced.is_set.return_value = False
+    api.get_namespaces_by(labels={"status": "stale"})
+    mock_v1.list_namespace.assert_called_once_with(
+        label_selector="status=stale",
+        resource_version="0",
+        _request_timeout=10,
+    )
+
+
+def test_get_namespaces_by_informer_index(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_v1 = mocks["mock_core_v1_api"]
+
+    mock_ns1 = MagicMock()
+    mock_ns1.metadata.name = "namespace1"
+    mock_ns1.metadata.labels = {"status": "stale"}
+    mock_ns2 = MagicMock()
+    mock_ns2.metadata.name = "namespace2"
+    mock_ns2.metadata.labels = {"status": "failed"}
+
+    api = KubernetesAPI()
+    api.namespace_informer = MagicMock()
+    api.namespace_informer.has_index.side_effect = lambda key: key == "status"
+    api.namespace_informer.by_index.side_effect = lambda key, value: {
+        "stale": [mock_ns1],
+        "failed": [mock_ns2],
+    }.get(value, [])
+    namespaces = api.get_namespaces_by(
+        labels={"managed": "true", "status": ["failed", "stale", "failed"]},
+    )
+
+    assert namespaces == []
+    api.namespace_informer.list.assert_not_called()
+
+    mock_ns1.metadata.labels["managed"] = "true"
+    mock_ns2.metadata.labels["managed"] = "true"
+    namespaces = api.get_namespaces_by(
+        labels={"managed": "true", "status": ["failed", "stale", "failed"]},
+    )
+    assert namespaces == [mock_ns2, mock_ns1]
+    mock_v1.list_namespace.assert_not_called()
+
+
 def test_get_namespaces_by_exclude_annotations(mock_kubernetes_api):
     mocks = mock_kubernetes_api
     mock_v1 = mocks["mock_core_v1_api"]
@@ -225,7 +420,9 @@ def test_get_namespaces_by_exclude_annotations(mock_kubernetes_api):
     assert len(namespaces) == 1
     assert namespaces[0].metadata.name == "namespace2"
     mock_v1.list_namespace.assert_called_once_with(
-        label_selector="", _request_timeout=10
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -253,7 +450,9 @@ def test_get_namespaces_by_exclude_labels_and_annotations(mock_kubernetes_api):
     assert len(namespaces) == 1
     assert namespaces[0].metadata.name == "namespace2"
     mock_v1.list_namespace.assert_called_once_with(
-        label_selector="env!=prod", _request_timeout=10
+        label_selector="env!=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -270,7 +469,9 @@ def test_get_namespaces_by_no_labels(mock_kubernetes_api):
     assert len(namespaces) == 1
     assert namespaces[0].metadata.name == "test"
     mock_v1.list_namespace.assert_called_once_with(
-        label_selector="", _request_timeout=10
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -286,7 +487,9 @@ def test_get_namespaces_by_failure(mock_kubernetes_api):
     namespaces = api.get_namespaces_by()
     assert namespaces == []
     mock_v1.list_namespace.assert_called_once_with(
-        label_selector="", _request_timeout=10
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -439,7 +642,7 @@ def test_patch_namespace_success(mock_kubernetes_api):
     mock_v1 = mocks["mock_core_v1_api"]
 
     api = KubernetesAPI()
-    api.patch_namespace(
+    assert api.patch_namespace(
         "default", labels={"env": "prod"}, annotations={"team": "dev"}
     )
     body = {
@@ -458,7 +661,7 @@ def test_patch_namespace_failure(mock_kubernetes_api):
     )
 
     api = KubernetesAPI()
-    api.patch_namespace(
+    assert not api.patch_namespace(
         "default", labels={"env": "prod"}, annotations={"team": "dev"}
     )
     mock_v1.patch_namespace.assert_called_once_with(
@@ -473,6 +676,39 @@ def test_patch_namespace_failure(mock_kubernetes_api):
     )
 
 
+# Test apply_namespace
+
+
+def test_apply_namespace(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_v1 = mocks["mock_core_v1_api"]
+
+    api = KubernetesAPI()
+    api.apply_namespace(
+        "default", labels={"env": "prod"}, annotations={"team": "dev"}
+    )
+    mock_v1.patch_namespace.assert_called_once_with(
+        name="default",
+        body={
+            "apiVersion": "v1",
+            "kind": "Namespace",
+            "metadata": {
+                "name": "default",
+                "labels": {"env": "prod"},
+                "annotations": {"team": "dev"},
+            },
+        },
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type=APPLY_PATCH_CONTENT_TYPE,
+        _request_timeout=10,
+    )
+
+    mock_v1.patch_namespace.side_effect = ApiException(status=409)
+    with pytest.raises(ApiException):
+        api.apply_namespace("default", labels={"env": "prod"})
+
+
 # Test delete_namespace
 
 
@@ -523,7 +759,10 @@ def test_get_cronjobs_by_success(mock_kubernetes_api):
     assert len(cronjobs) == 1
     assert cronjobs[0].metadata.annotations["cron-type"] == "daily"
     mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -549,7 +788,10 @@ def test_get_cronjobs_by_exclude_labels(mock_kubernetes_api):
     assert len(cronjobs) == 1
     assert cronjobs[0].metadata.name == "cronjob2"
     mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="env!=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -575,7 +817,10 @@ def test_get_cronjobs_by_exclude_annotations(mock_kubernetes_api):
     assert len(cronjobs) == 1
     assert cronjobs[0].metadata.name == "cronjob2"
     mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -608,7 +853,10 @@ def test_get_cronjobs_by_exclude_labels_and_annotations(mock_kubernetes_api):
     assert len(cronjobs) == 1
     assert cronjobs[0].metadata.name == "cronjob2"
     mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="env!=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -621,7 +869,10 @@ def test_get_cronjobs_by_empty(mock_kubernetes_api):
     cronjobs = api.get_cronjobs_by("default")
     assert len(cronjobs) == 0
     mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -636,7 +887,44 @@ def test_get_cronjobs_by_failure(mock_kubernetes_api):
     cronjobs = api.get_cronjobs_by("default")
     assert len(cronjobs) == 0
     mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
+    )
+
+
+def test_get_cronjobs_by_informer(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_batch_v1 = mocks["mock_batch_v1_api"]
+
+    mock_cronjob1 = MagicMock()
+    mock_cronjob1.metadata.labels = {"action": "check"}
+    mock_cronjob1.metadata.annotations = {"namespace": "ns1"}
+    mock_cronjob2 = MagicMock()
+    mock_cronjob2.metadata.labels = {"action": "owner"}
+    mock_cronjob2.metadata.annotations = {"namespace": "ns1"}
+
+    api = KubernetesAPI()
+    api.cronjob_informer = MagicMock()
+    api.cronjob_informer.list_kwargs = {"namespace": "default"}
+    api.cronjob_informer.has_index.return_value = False
+    api.cronjob_informer.list.return_value = [mock_cronjob1, mock_cronjob2]
+    cronjobs = api.get_cronjobs_by(
+        "default",
+        labels={"action": "check"},
+        annotations={"namespace": "ns1"},
+    )
+
+    assert cronjobs == [mock_cronjob1]
+    mock_batch_v1.list_namespaced_cron_job.assert_not_called()
+
+    api.get_cronjobs_by("other", labels={"action": "check"})
+    mock_batch_v1.list_namespaced_cron_job.assert_called_once_with(
+        namespace="other",
+        label_selector="action=check",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -663,7 +951,10 @@ def test_get_jobs_by_success(mock_kubernetes_api):
     assert len(jobs) == 1
     assert jobs[0].metadata.name == "job1"
     mock_batch_v1.list_namespaced_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="env=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -687,7 +978,10 @@ def test_get_jobs_by_exclude_labels(mock_kubernetes_api):
     assert len(jobs) == 1
     assert jobs[0].metadata.name == "job2"
     mock_batch_v1.list_namespaced_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="env!=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -713,7 +1007,10 @@ def test_get_jobs_by_exclude_annotations(mock_kubernetes_api):
     assert len(jobs) == 1
     assert jobs[0].metadata.name == "job2"
     mock_batch_v1.list_namespaced_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -746,7 +1043,10 @@ def test_get_jobs_by_exclude_labels_and_annotations(mock_kubernetes_api):
     assert len(jobs) == 1
     assert jobs[0].metadata.name == "job2"
     mock_batch_v1.list_namespaced_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="env!=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -759,7 +1059,10 @@ def test_get_jobs_by_empty(mock_kubernetes_api):
     jobs = api.get_jobs_by(namespace="default", labels={"env": "prod"})
     assert len(jobs) == 0
     mock_batch_v1.list_namespaced_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="env=prod",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -774,7 +1077,10 @@ def test_get_jobs_by_failure(mock_kubernetes_api):
     jobs = api.get_jobs_by(namespace="default")
     assert jobs == []
     mock_batch_v1.list_namespaced_job.assert_called_once_with(
-        namespace="default", _request_timeout=10
+        namespace="default",
+        label_selector="",
+        resource_version="0",
+        _request_timeout=10,
     )
 
 
@@ -800,3 +1106,36 @@ def test_to_dto_none(mock_kubernetes_api):
     api = KubernetesAPI()
     dto = api.to_dto(None)
     assert dto is None
+
+
+def test_get_jobs_by_informer(mock_kubernetes_api):
+    mocks = mock_kubernetes_api
+    mock_batch_v1 = mocks["mock_batch_v1_api"]
+
+    mock_job1 = MagicMock()
+    mock_job1.metadata.labels = {"action": "owner"}
+    mock_job2 = MagicMock()
+    mock_job2.metadata.labels = {"action": "check"}
+
+    api = KubernetesAPI()
+    api.job_informer = MagicMock()
+    api.job_informer.list_kwargs = {"namespace": "default"}
+    api.job_informer.has_index.side_effect = lambda key: key == "action"
+    api.job_informer.by_index.side_effect = lambda key, value: {
+        "owner": [mock_job1],
+        "check": [mock_job2],
+    }.get(value, [])
+    jobs = api.get_jobs_by("default", labels={"action": "owner"})
+
+    assert jobs == [mock_job1]
+    api.job_informer.list.assert_not_called()
+    mock_batch_v1.list_namespaced_job.assert_not_called()
+
+    api.job_informer.synced.is_set.return_value = False
+    api.get_jobs_by("default", labels={"action": "owner"})
+    mock_batch_v1.list_namespaced_job.assert_called_once_with(
+        namespace="default",
+        label_selector="action=owner",
+        resource_version="0",
+        _request_timeout=10,
+    )
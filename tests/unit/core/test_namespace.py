@@ -196,3 +196,15 @@ def test_match_namespace():
         assert scenario.get("matching") == match_namespace(
             configs, scenario.get("namespace")
         )
+
+
+def test_namespace_matcher_name_patterns():
+    matcher = NamespaceMatcher(names=["ci-.*", "staging-.*"])
+    assert matcher.name_patterns is matcher.name_patterns
+    assert [pattern.pattern for pattern in matcher.name_patterns] == [
+        "ci-.*",
+        "staging-.*",
+    ]
+    assert NamespaceMatcher().name_patterns == ()
+    assert match_namespace([matcher], Namespace(name="ci-test")) is matcher
+    assert match_namespace([matcher], Namespace(name="dev-test")) is None
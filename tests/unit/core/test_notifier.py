@@ -1,5 +1,9 @@
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+from slack_sdk.errors import SlackApiError
+
 from ska_ser_namespace_manager.core.notifier import Notifier
 from ska_ser_namespace_manager.core.utils import encode_slack_address
 
@@ -85,3 +89,118 @@ def test_marvin_quote():
         notifier = Notifier(slack_token="fake_slack_token")
         assert len(notifier.get_marvin_quote("failing")) > 0
         assert len(notifier.get_marvin_quote(None)) > 0
+
+
+def test_notifier_reuses_template_factory():
+    with patch(
+        "ska_ser_namespace_manager.core.notifier.TemplateFactory"
+    ) as mock_template_factory:
+        notifier = Notifier.__new__(Notifier)
+        notifier.template_factory = MagicMock()
+        template_factory = notifier.template_factory
+        Notifier.__init__(notifier, slack_token=None)
+
+        assert notifier.template_factory is template_factory
+        mock_template_factory.assert_not_called()
+
+
+def test_queue_notification_no_slack_token():
+    with patch("ska_ser_namespace_manager.core.notifier.TemplateFactory"):
+        notifier = Notifier(slack_token=None)
+        assert not notifier.queue_notification("a", "t", "s", key="ns")
+        assert notifier.notification_queue.empty()
+        assert notifier.pending_notifications == set()
+
+
+def test_queue_notification_deduplicates():
+    with patch(
+        "ska_ser_namespace_manager.core.notifier.TemplateFactory"
+    ), patch("ska_ser_namespace_manager.core.notifier.App", autospec=True):
+        notifier = Notifier(slack_token="fake_slack_token")
+        assert notifier.queue_notification("a", "t", "s", key="ns")
+        assert not notifier.queue_notification("a", "t", "s", key="ns")
+        assert notifier.queue_notification("a", "t", "s")
+        assert notifier.notification_queue.qsize() == 2
+
+
+def test_process_notifications():
+    with patch(
+        "ska_ser_namespace_manager.core.notifier.TemplateFactory"
+    ) as mock_template_factory, patch(
+        "ska_ser_namespace_manager.core.notifier.App", autospec=True
+    ) as mock_app:
+        mock_template_factory.return_value.render.return_value = (
+            "Mocked Message"
+        )
+        mock_post = mock_app.return_value.client.chat_postMessage
+        notifier = Notifier(slack_token="fake_slack_token")
+        callback = MagicMock(return_value=True)
+        address = encode_slack_address("marvin", "marvin")
+        other_address = encode_slack_address("arthur", "arthur")
+        notifier.queue_notification(
+            address, "template_name", "failing", key="ns1", callback=callback
+        )
+        notifier.queue_notification(address, "template_name", "stale")
+        notifier.queue_notification(other_address, "template_name", "stale")
+
+        # Second notification to the same address is deferred
+        assert notifier.process_notifications() == 2
+        assert mock_post.call_count == 2
+        callback.assert_called_once()
+        assert notifier.notification_queue.qsize() == 1
+
+        # The callback keeps the key pending until it is released
+        assert notifier.pending_notifications == {"ns1"}
+        assert not notifier.queue_notification(
+            address, "template_name", "failing", key="ns1"
+        )
+        notifier.release_notification("ns1")
+        assert notifier.pending_notifications == set()
+
+        notifier.last_notified_at[address] = 0.0
+        assert notifier.process_notifications() == 1
+        assert notifier.notification_queue.empty()
+
+        callback.return_value = False
+        notifier.last_notified_at[address] = 0.0
+        notifier.queue_notification(
+            address, "template_name", "failing", key="ns1", callback=callback
+        )
+        assert notifier.process_notifications() == 1
+        assert notifier.pending_notifications == set()
+
+
+@pytest.mark.parametrize("header", ["Retry-After", "retry-after"])
+def test_process_notifications_rate_limited(header):
+    with patch(
+        "ska_ser_namespace_manager.core.notifier.TemplateFactory"
+    ) as mock_template_factory, patch(
+        "ska_ser_namespace_manager.core.notifier.App", autospec=True
+    ) as mock_app:
+        mock_template_factory.return_value.render.return_value = (
+            "Mocked Message"
+        )
+        response = MagicMock()
+        response.status_code = 429
+        response.headers = {header: "30"}
+        mock_post = mock_app.return_value.client.chat_postMessage
+        mock_post.side_effect = SlackApiError("ratelimited", response)
+        notifier = Notifier(slack_token="fake_slack_token")
+        callback = MagicMock()
+        notifier.queue_notification(
+            encode_slack_address("marvin", "marvin"),
+            "template_name",
+            "failing",
+            key="ns1",
+            callback=callback,
+        )
+
+        assert notifier.process_notifications() == 0
+        callback.assert_not_called()
+        assert notifier.pending_notifications == {"ns1"}
+        assert notifier.notification_queue.qsize() == 1
+        assert notifier.notifications_paused_until > time.monotonic() + 20
+
+        # Paused notifications are not sent
+        assert notifier.process_notifications() == 0
+        assert mock_post.call_count == 1
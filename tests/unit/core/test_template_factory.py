@@ -44,3 +44,16 @@ class TestTemplates:
         factory = TemplateFactory(templates_custom_path)
         with pytest.raises(TemplateError):
             factory.render("nonexistent.txt")
+
+    def test_render_template_cached(self, templates_custom_path):
+        factory = TemplateFactory(templates_custom_path)
+        assert factory.render("template.j2", name="World") == "Hello, World!"
+
+        with open(
+            os.path.join(templates_custom_path, "template.j2"),
+            encoding="utf-8",
+            mode="w+",
+        ) as tf:
+            tf.write("Bye, {{ name }}!")
+
+        assert factory.render("template.j2", name="World") == "Hello, World!"
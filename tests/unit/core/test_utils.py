@@ -1,6 +1,7 @@
 import base64
 import binascii
 import datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 import pytz
@@ -9,7 +10,9 @@ from ska_ser_namespace_manager.core.utils import (
     decode_slack_address,
     encode_slack_address,
     format_utc,
+    log_config,
     parse_timedelta,
+    spec_hash,
     utc,
 )
 
@@ -67,3 +70,30 @@ def test_decode_slack_address_invalid():
     with pytest.raises((binascii.Error, UnicodeDecodeError)):
         decode_slack_address("asdasdasdasd")
         decode_slack_address("encoded_user")
+
+
+def test_spec_hash():
+    assert len(spec_hash("metadata:\n  name: test\n")) == 32
+    assert spec_hash("a: 1\n") == spec_hash("a: 1\n")
+    assert spec_hash("a: 1\n") != spec_hash("a: 2\n")
+
+
+def test_log_config():
+    config = MagicMock()
+    config.model_dump.return_value = {"a": 1}
+    with patch(
+        "ska_ser_namespace_manager.core.utils.logging.debug"
+    ) as mock_logging_debug, patch(
+        "ska_ser_namespace_manager.core.utils.logging.getLogger"
+    ) as mock_get_logger:
+        mock_get_logger.return_value.isEnabledFor.return_value = False
+        log_config(config)
+        config.model_dump.assert_not_called()
+        mock_logging_debug.assert_not_called()
+
+        mock_get_logger.return_value.isEnabledFor.return_value = True
+        log_config(config)
+        config.model_dump.assert_called_once_with(mode="json")
+        mock_logging_debug.assert_called_once_with(
+            "Configuration: \n%s", "a: 1\n"
+        )
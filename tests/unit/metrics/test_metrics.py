@@ -12,25 +12,15 @@ from ska_ser_namespace_manager.core.types import (
 from ska_ser_namespace_manager.metrics.metrics import MetricsManager
 from ska_ser_namespace_manager.metrics.metrics_config import MetricsConfig
 
-TEST_METRICS_PATH = os.path.join("tests", "metrics")
-
 
 @pytest.fixture
-def temp_metrics_path():
-    metrics_folder = TEST_METRICS_PATH
-    metrics_file = os.path.join(metrics_folder, "metrics.prom")
-    if os.path.exists(metrics_file):
-        os.remove(metrics_file)
-
-    if not os.path.exists(metrics_folder):
-        os.makedirs(metrics_folder)
-
-    yield metrics_folder
+def temp_metrics_path(tmp_path):
+    yield str(tmp_path)
 
 
 @pytest.fixture
-def metrics_manager():
-    manager = MetricsManager(MetricsConfig(registry_path=TEST_METRICS_PATH))
+def metrics_manager(temp_metrics_path):
+    manager = MetricsManager(MetricsConfig(registry_path=temp_metrics_path))
     yield manager
 
 
@@ -81,7 +71,9 @@ def test_update_metrics(metrics_manager):
             },
         )
     )
+    assert not metrics_manager.dirty
     metrics_manager.update_namespace_metrics(test_namespace)
+    assert metrics_manager.dirty
 
     metrics = generate_latest(metrics_manager.registry).decode("utf-8")
     parsed_metrics = parse_metrics_output(metrics)
@@ -121,6 +113,7 @@ def test_save_metrics(metrics_manager, temp_metrics_path):
     )
     metrics_manager.update_namespace_metrics(test_namespace)
     metrics_manager.save_metrics()
+    assert not metrics_manager.dirty
 
     metrics_file = os.path.join(temp_metrics_path, "metrics.prom")
 
@@ -174,3 +167,72 @@ def test_load_metrics(metrics_manager, temp_metrics_path):
         == expected_labels
     )
     assert parsed_metrics["namespace_manager_ns_status"]["value"] == 0.0
+
+
+def test_delete_stale_metrics(metrics_manager):
+    for name in ["ns1", "ns2", "ns3"]:
+        metrics_manager.update_namespace_metrics(
+            V1Namespace(metadata=V1ObjectMeta(name=name))
+        )
+
+    metrics_manager.delete_stale_metrics(name for name in ["ns2"])
+
+    assert [
+        sample.labels["namespace"]
+        for sample in metrics_manager.namespace_manager_ns_status._samples()
+    ] == ["ns2"]
+    assert [key[-1] for key in metrics_manager.status_children] == ["ns2"]
+
+
+def test_delete_namespaces_metrics(metrics_manager):
+    for name in ["ns1", "ns2", "ns3"]:
+        metrics_manager.update_namespace_metrics(
+            V1Namespace(metadata=V1ObjectMeta(name=name))
+        )
+
+    metrics_manager.dirty = False
+    metrics_manager.delete_namespaces_metrics([])
+    assert not metrics_manager.dirty
+
+    metrics_manager.delete_namespaces_metrics(["ns1", "ns3"])
+
+    assert metrics_manager.dirty
+    namespaces = {
+        sample.labels["namespace"]
+        for sample in metrics_manager.namespace_manager_ns_status._samples()
+    }
+    assert "ns2" in namespaces
+    assert not namespaces & {"ns1", "ns3"}
+    assert [key[-1] for key in metrics_manager.status_children] == ["ns2"]
+
+
+def test_update_metrics_reuses_children(metrics_manager):
+    namespace = V1Namespace(metadata=V1ObjectMeta(name="ns1"))
+    metrics_manager.update_namespace_metrics(namespace)
+    child = next(iter(metrics_manager.status_children.values()))
+
+    namespace.metadata.annotations = {
+        NamespaceAnnotations.STATUS.value: NamespaceStatus.FAILING.value
+    }
+    metrics_manager.update_namespace_metrics(namespace)
+
+    assert list(metrics_manager.status_children.values()) == [child]
+    assert child._value.get() == 2.0
+
+    metrics_manager.load_metrics()
+    assert not metrics_manager.status_children
+
+
+def test_update_namespaces_metrics(metrics_manager):
+    metrics_manager.update_namespaces_metrics([])
+    assert not metrics_manager.dirty
+
+    metrics_manager.update_namespaces_metrics(
+        V1Namespace(metadata=V1ObjectMeta(name=name))
+        for name in ["ns1", "ns2"]
+    )
+    assert metrics_manager.dirty
+    assert {
+        sample.labels["namespace"]
+        for sample in metrics_manager.namespace_manager_ns_status._samples()
+    } >= {"ns1", "ns2"}